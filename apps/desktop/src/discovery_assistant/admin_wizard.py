@@ -474,6 +474,10 @@ class AdminSetupWizard(QtWidgets.QDialog):
 
     def _update_navigation(self, can_proceed: bool):
         """Update navigation based on page validation"""
+        # Pages validate on timers, so a page left behind can still emit; only the current page drives Next
+        sender = self.sender()
+        if sender is not None and sender is not self.pages[self.current_step]:
+            return
         self.btn_next.setEnabled(can_proceed)
 
     def _cancel_wizard(self):
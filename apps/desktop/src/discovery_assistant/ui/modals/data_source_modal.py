@@ -10,7 +10,9 @@ from PySide6 import QtWidgets, QtCore, QtGui
 class DataSource:
     """Represents a single data source"""
 
-    CATEGORIES = [
+    __slots__ = ("id", "category", "name", "description")
+
+    CATEGORIES = (
         ("email", "Email System"),
         ("crm", "CRM/Customer Database"),
         ("storage", "Document Storage"),
@@ -19,7 +21,7 @@ class DataSource:
         ("communication", "Team Communication"),
         ("inventory", "Inventory Management"),
         ("other", "Other")
-    ]
+    )
 
     # Color coding for categories (matching Admin Instructions pattern)
     CATEGORY_COLORS = {
@@ -57,6 +59,10 @@ class DataSource:
         return source
 
 
+# Combo box contents, split once from DataSource.CATEGORIES
+_CATEGORY_VALUES, _CATEGORY_LABELS = zip(*DataSource.CATEGORIES)
+
+
 class DataSourceModal(QtWidgets.QDialog):
     """Modal dialog for adding or editing a data source"""
 
@@ -69,6 +75,12 @@ class DataSourceModal(QtWidgets.QDialog):
         self.preset_name = preset_name
         self.is_edit_mode = source is not None
 
+        # Name validation runs once typing pauses rather than on every keystroke
+        self._validate_timer = QtCore.QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(50)
+        self._validate_timer.timeout.connect(self._validate_form)
+
         self._setup_ui()
         self._apply_styles()
         self._connect_signals()
@@ -97,8 +109,9 @@ class DataSourceModal(QtWidgets.QDialog):
         # Category dropdown
         self.category_combo = QtWidgets.QComboBox()
         self.category_combo.setFixedHeight(35)
-        for value, display in DataSource.CATEGORIES:
-            self.category_combo.addItem(display, value)
+        self.category_combo.addItems(_CATEGORY_LABELS)
+        for i, value in enumerate(_CATEGORY_VALUES):
+            self.category_combo.setItemData(i, value)
 
         # Only set default to "Other" if no preset category was provided
         if not self.preset_category and not self.is_edit_mode:
@@ -207,7 +220,7 @@ class DataSourceModal(QtWidgets.QDialog):
 
     def _connect_signals(self):
         """Connect UI signals"""
-        self.name_input.textChanged.connect(self._validate_form)
+        self.name_input.textChanged.connect(self._validate_timer.start)
         self.cancel_btn.clicked.connect(self.reject)
         self.save_btn.clicked.connect(self._save_and_close)
 
@@ -222,6 +235,7 @@ class DataSourceModal(QtWidgets.QDialog):
         # Set name and description
         self.name_input.setText(self.source.name)
         self.description_input.setPlainText(self.source.description)
+        self._validate_form()
 
     def _apply_preset(self):
         """Apply preset values from template"""
@@ -236,14 +250,21 @@ class DataSourceModal(QtWidgets.QDialog):
             # Select all text so user can immediately type to replace
             self.name_input.selectAll()
             self.name_input.setFocus()
+            self._validate_form()
 
     def _validate_form(self):
         """Enable save button only if name is provided"""
-        has_name = bool(self.name_input.text().strip())
-        self.save_btn.setEnabled(has_name)
+        self._validate_timer.stop()
+        # isspace() answers the same question as strip() without building a new string per keystroke
+        name = self.name_input.text()
+        self.save_btn.setEnabled(bool(name) and not name.isspace())
 
     def _save_and_close(self):
         """Save the data source and close dialog"""
+        # Save can land inside the debounce window, so settle validation first
+        self._validate_form()
+        if not self.name_input.text().strip():
+            return
         self.source.category = self.category_combo.currentData()
         self.source.name = self.name_input.text().strip()
         self.source.description = self.description_input.toPlainText().strip()
@@ -1,9 +1,21 @@
+from typing import Dict
 from PySide6 import QtWidgets, QtCore, QtGui
 
 
 class WarningWidget(QtWidgets.QWidget):
     """Reusable warning/info box with icon and message"""
 
+    # Icons decoded once per path and shared by every instance (QPixmap is implicitly shared)
+    _pixmap_cache: Dict[str, QtGui.QPixmap] = {}
+
+    @classmethod
+    def _load_pixmap(cls, icon_path: str) -> QtGui.QPixmap:
+        """Return the pixmap for icon_path, decoding the file only on first use"""
+        pixmap = cls._pixmap_cache.get(icon_path)
+        if pixmap is None:
+            pixmap = cls._pixmap_cache[icon_path] = QtGui.QPixmap(icon_path)
+        return pixmap
+
     def __init__(self, message: str, icon_path: str = None, parent=None):
         super().__init__(parent)
 
@@ -29,7 +41,7 @@ class WarningWidget(QtWidgets.QWidget):
         self.icon_widget.setStyleSheet("background: transparent; border: none;")
 
         if icon_path:
-            pixmap = QtGui.QPixmap(icon_path)
+            pixmap = self._load_pixmap(icon_path)
             if not pixmap.isNull():
                 self.icon_widget.setPixmap(pixmap)
             else:
@@ -64,6 +76,6 @@ class WarningWidget(QtWidgets.QWidget):
 
     def set_icon(self, icon_path: str):
         """Update the icon"""
-        pixmap = QtGui.QPixmap(icon_path)
+        pixmap = self._load_pixmap(icon_path)
         if not pixmap.isNull():
             self.icon_widget.setPixmap(pixmap)
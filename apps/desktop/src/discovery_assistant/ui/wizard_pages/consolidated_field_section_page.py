@@ -3,10 +3,357 @@ Consolidated Field & Section Configuration Page - Step 4 of Admin Setup Wizard
 Combines section selection and field customization in a single, intuitive interface.
 """
 
-from typing import Dict, Any, Tuple, List
+import sys
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Dict, Any, Optional, Tuple, List
 from PySide6 import QtWidgets, QtCore, QtGui
 from discovery_assistant.wizard_base import WizardPage
-from discovery_assistant.policy_utils import normalize_field_key, normalize_section_key
+from discovery_assistant.policy_utils import normalize_field_key
+from discovery_assistant.ui.wizard_pages.page_styles import PAGE_HEADER_QSS
+
+SECTION_CHROME_QSS = """
+    QLabel#sectionName {
+        font-size: 18px;
+        font-weight: 600;
+        color: #F9FAFB;
+        background: transparent;
+        border: none;
+    }
+    QLabel#requiredBadge {
+        color: #0BE5F5;
+        font-size: 12px;
+        font-weight: bold;
+        background-color: rgba(11, 229, 245, 0.1);
+        padding: 4px 8px;
+        border-radius: 4px;
+        border: none;
+    }
+    QWidget#sectionTitleBar {
+        background-color: #1A415E;
+        border: none;
+        border-radius: 8px;
+        margin-bottom: 0px;
+    }
+    QWidget#sectionContent {
+        background-color: #1a1a1a;
+        margin-bottom: 15px;
+    }
+    QWidget#descriptionColumn {
+        background: transparent;
+        border: none;
+    }
+    QLabel#purposeLabel {
+        color: #F9FAFB;
+        font-size: 16px;
+        font-weight: 600;
+        margin-bottom: 8px;
+        background: transparent;
+        border: none;
+    }
+    QLabel#descriptionLabel {
+        color: #D1D5DB;
+        font-size: 14px;
+        line-height: 1.5;
+        background: transparent;
+        border: none;
+        margin-bottom: 15px;
+    }
+    QLabel#genericPreview {
+        color: #6B7280;
+        font-style: italic;
+        font-size: 14px;
+        background: #F9FAFB;
+        border: 2px dashed #E5E7EB;
+        border-radius: 8px;
+        padding: 40px;
+        margin: 20px;
+    }
+"""
+
+# The preview card's own rule only sets its box; RoundedCard paints the background.
+# The card's labels share one box reset and the per-label rules below only add
+# their font and color on top of it.
+CARD_QSS = """
+    QFrame#previewCard {
+        background: transparent;
+        border: 1px solid transparent;
+        margin: 20px 20px 35px 20px;
+    }
+    #previewCard QLabel {
+        background: transparent;
+        border: none;
+        margin: 0px;
+        padding: 0px;
+    }
+"""
+
+TITLE_QSS = """
+    QLabel#previewTitle {
+        font-size: 16px;
+        font-weight: 600;
+        color: #1F2937;
+    }
+"""
+
+SUBTITLE_QSS = """
+    QLabel#previewSubtitle {
+        color: #6B7280;
+        font-size: 12px;
+    }
+"""
+
+SECTION_HEADER_QSS = """
+    QLabel#previewSectionHeader {
+        font-size: 14px;
+        font-weight: 600;
+        color: #374151;
+        margin: 8px 0px 4px 0px;
+    }
+"""
+
+PREVIEW_CARD_QSS = CARD_QSS + TITLE_QSS + SUBTITLE_QSS + SECTION_HEADER_QSS
+
+PAGE_QSS = PAGE_HEADER_QSS + SECTION_CHROME_QSS + PREVIEW_CARD_QSS
+
+# Field label color and size go through palette and font, which are far cheaper to
+# change than a stylesheet. The font is built on first use since it needs a QApplication.
+FIELD_LABEL_COLOR = "#334155"
+FIELD_LABEL_DISABLED_COLOR = "#9CA3AF"
+_field_label_font = None
+
+
+def _get_field_label_font() -> QtGui.QFont:
+    global _field_label_font
+    if _field_label_font is None:
+        _field_label_font = QtGui.QFont()
+        _field_label_font.setPixelSize(13)
+    return _field_label_font
+
+
+_field_cursors = None
+
+
+def _get_field_cursor(required: bool) -> QtGui.QCursor:
+    """Shared forbidden/pointing cursors for field rows, built once like the label font"""
+    global _field_cursors
+    if _field_cursors is None:
+        _field_cursors = {
+            True: QtGui.QCursor(QtCore.Qt.ForbiddenCursor),
+            False: QtGui.QCursor(QtCore.Qt.PointingHandCursor),
+        }
+    return _field_cursors[required]
+
+
+def _set_label_color(label: QtWidgets.QLabel, color: str) -> None:
+    palette = label.palette()
+    palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor(color))
+    label.setPalette(palette)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSpec:
+    """Static definition of one preview field, with interned strings and its display label"""
+    name: str
+    placeholder: str
+    required: bool
+    type: Optional[str] = None
+    label_text: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "placeholder", sys.intern(self.placeholder))
+        label_text = sys.intern(self.name + " *") if self.required else self.name
+        object.__setattr__(self, "label_text", label_text)
+
+
+# Static preview field definitions, shared read-only by every page instance
+_RESPONDENT_FIELDS = (
+    FieldSpec(name="Full Name", placeholder="e.g., Dana Rivera", required=True),
+    FieldSpec(name="Work Email", placeholder="dana@company.com", required=True),
+    FieldSpec(name="Department", placeholder="e.g., Support", required=False),
+    FieldSpec(name="Role / Title", placeholder="Customer Support Lead", required=False),
+    FieldSpec(name="Primary Responsibilities", placeholder="Summarize duties & metrics", required=False,
+              type="textarea"),
+)
+
+_FEATURE_IDEAS_FIELDS = (
+    FieldSpec(name="Feature Title", placeholder="e.g., Automated Email Response System", required=True),
+    FieldSpec(name="Problem Description", placeholder="What specific problem does this solve?", required=True,
+              type="textarea"),
+    FieldSpec(name="Expected Outcome", placeholder="How would you know this automation is working successfully?",
+              required=True, type="textarea"),
+    FieldSpec(name="Implementation Steps", placeholder="Multi-step process editor with data dependency tracking",
+              required=False),
+    FieldSpec(name="Screenshots/Attachments", placeholder="Supporting documentation", required=False),
+)
+
+_ORG_MAP_FIELDS = (
+    FieldSpec(name="Reports To", placeholder="Manager name/title", required=False),
+    FieldSpec(name="Peer Teams", placeholder="e.g. Sales Ops, QA", required=False),
+    FieldSpec(name="Downstream Consumers", placeholder="e.g., Support", required=False),
+    FieldSpec(name="Org Notes", placeholder="Key handoffs, dependencies, SLAs", required=False,
+              type="textarea"),
+)
+
+_PAIN_POINTS_FIELDS = (
+    FieldSpec(name="Pain Name", placeholder="Brief name for this pain point (e.g., Manual data entry delays)",
+              required=True),
+    FieldSpec(name="Impact", placeholder="Very Low, Low, Medium, High, Very High", required=True),
+    FieldSpec(name="Frequency", placeholder="Randomly, Daily, Weekly, Monthly, Yearly", required=True),
+    FieldSpec(name="Notes", placeholder="Describe the issue, downstream effects, and potential workarounds...",
+              required=True, type="textarea"),
+    FieldSpec(name="Screenshots/Attachments", placeholder="Supporting documentation", required=False),
+)
+
+_DATA_SOURCES_FIELDS = (
+    FieldSpec(name="Source Name", placeholder="Descriptive name for this data source (e.g., Customer Database)",
+              required=True),
+    FieldSpec(name="Connection Type", placeholder="Database, API/Web Service, File System, Cloud Service, etc.",
+              required=True),
+    FieldSpec(name="Description", placeholder="Describe what data this source contains and how it will be used...",
+              required=True, type="textarea"),
+    FieldSpec(name="Screenshots/Attachments", placeholder="Supporting documentation", required=False),
+)
+
+_COMPLIANCE_FIELDS = (
+    # Organization Context (Required)
+    FieldSpec(name="Industry Sector",
+              placeholder="e.g., Healthcare, Financial Services, Manufacturing, Technology", required=True),
+    FieldSpec(name="Company Size", placeholder="Micro, Small, Medium, Large, Enterprise", required=True),
+    FieldSpec(name="Geographic Scope",
+              placeholder="Countries/regions where you operate (e.g., US, EU, Canada, Global)", required=True),
+    FieldSpec(name="Business Activities",
+              placeholder="Key business activities that may trigger compliance requirements", required=True,
+              type="textarea"),
+
+    # Individual Requirements (Required)
+    FieldSpec(name="Requirement Name", placeholder="e.g., GDPR Article 32 - Security of Processing",
+              required=True),
+    FieldSpec(name="Authority/Regulator", placeholder="e.g., GDPR, SEC, FDA, OSHA", required=True),
+
+    # Optional fields for admin control
+    FieldSpec(name="Data Types Handled", placeholder="Types of data you collect/process", required=False,
+              type="textarea"),
+    FieldSpec(name="Third-Party Vendors", placeholder="Key vendors that may impact compliance", required=False,
+              type="textarea"),
+    FieldSpec(name="Responsible Person", placeholder="Name or role responsible for this requirement",
+              required=False),
+    FieldSpec(name="Evidence Required", placeholder="Required documentation and evidence", required=False,
+              type="textarea"),
+    FieldSpec(name="Status", placeholder="Not Assessed, Compliant, Non-Compliant, In Progress", required=False),
+    FieldSpec(name="Risk Level", placeholder="Low, Medium, High, Critical", required=False),
+    FieldSpec(name="Notes", placeholder="Additional compliance notes, requirements, and considerations...",
+              required=False, type="textarea"),
+    FieldSpec(name="Screenshots/Attachments", placeholder="Supporting documentation", required=False),
+)
+
+_PROCESSES_FIELDS = (
+    FieldSpec(name="Title", placeholder="Process title (e.g., Client Onboarding Workflow)", required=True),
+    FieldSpec(name="Notes", placeholder="Briefly describe the steps, systems involved, and expected outcomes.",
+              required=True, type="textarea"),
+    FieldSpec(name="Screenshots/Attachments", placeholder="Supporting documentation", required=False),
+)
+
+_REFERENCE_LIBRARY_FIELDS = (
+    FieldSpec(name="Document Title", placeholder="Descriptive title for this document", required=True),
+    FieldSpec(name="File Attachment", placeholder="Upload document or capture screenshot", required=True),
+    FieldSpec(name="Category", placeholder="Organizational, Process Documentation, Policies & Procedures, etc.",
+              required=False),
+    FieldSpec(name="Description", placeholder="Brief description of the document's content and purpose",
+              required=False, type="textarea"),
+    FieldSpec(name="Tags", placeholder="Keywords for organization and searchability", required=False),
+)
+
+_TIME_RESOURCE_OVERVIEW_FIELDS = (
+    FieldSpec(name="Primary Activities", placeholder="Describe your main work activities and responsibilities",
+              required=True, type="textarea"),
+    FieldSpec(name="Peak Workload Periods",
+              placeholder="When is your workload most intense? (daily, weekly, monthly patterns)", required=True,
+              type="textarea"),
+    FieldSpec(name="Resource Constraints",
+              placeholder="What limits your productivity? (tools, information, approvals, etc.)", required=True,
+              type="textarea"),
+    FieldSpec(name="Waiting Time", placeholder="Time spent waiting for approvals, information, responses, etc.",
+              required=True, type="textarea"),
+    FieldSpec(name="Overtime Patterns", placeholder="When and why do you work overtime?", required=True,
+              type="textarea"),
+    FieldSpec(name="Additional Notes", placeholder="Any other time management or resource-related observations",
+              required=True, type="textarea"),
+)
+
+_TIME_RESOURCE_TRACKING_FIELDS = (
+    FieldSpec(name="Activity Name", placeholder="e.g., Email processing, Report generation", required=False),
+    FieldSpec(name="Hours per Week", placeholder="Numeric input with spinner control", required=False),
+    FieldSpec(name="Priority Level", placeholder="High, Medium, Low", required=False),
+    FieldSpec(name="Activity Notes", placeholder="Additional details about this activity", required=False,
+              type="textarea"),
+    FieldSpec(name="Screenshots/Attachments", placeholder="Supporting documentation", required=False),
+)
+
+
+# Section key prefix -> fields, used to precompute the policy key of every preview field
+_PREVIEW_FIELDS_BY_PREFIX = {
+    "respondent_info": _RESPONDENT_FIELDS,
+    "org_map": _ORG_MAP_FIELDS,
+    "processes": _PROCESSES_FIELDS,
+    "pain_points": _PAIN_POINTS_FIELDS,
+    "data_sources": _DATA_SOURCES_FIELDS,
+    "compliance": _COMPLIANCE_FIELDS,
+    "feature_ideas": _FEATURE_IDEAS_FIELDS,
+    "reference_library": _REFERENCE_LIBRARY_FIELDS,
+    "time_resource_management": _TIME_RESOURCE_OVERVIEW_FIELDS + _TIME_RESOURCE_TRACKING_FIELDS,
+}
+
+# Title and subtitle shown at the top of each section's preview card
+_PREVIEW_HEADINGS = {
+    "respondent_info": ("Respondent Profile", "Please enter basic information about who you are."),
+    "org_map": ("Org Context", "Please describe where your role is positioned, and your collaborators."),
+    "processes": ("Core Processes", "Add one process per entry. You can attach documents and capture screenshots."),
+    "pain_points": (
+        "Pain Points",
+        "Identify areas where time is wasted or errors occur. Add attachments and screenshots for context.",
+    ),
+    "data_sources": (
+        "Data Sources",
+        "Configure connection details for databases, APIs, and other data systems. Credentials will be collected securely after export.",
+    ),
+    "compliance": (
+        "Compliance Requirements",
+        "Document regulatory requirements, compliance status, and evidence management for your organization.",
+    ),
+    "feature_ideas": (
+        "Feature Ideas",
+        "Describe automation opportunities by outlining step-by-step implementation processes.",
+    ),
+    "reference_library": (
+        "Reference Library",
+        "Central repository for organizational documents, policies, and reference materials.",
+    ),
+    "time_resource_management": (
+        "Time & Resource Management",
+        "Track how you spend your time and identify resource constraints that impact productivity.",
+    ),
+}
+
+_PREVIEW_PREFIX_BY_SECTION = {
+    "Respondent Info": "respondent_info",
+    "Org Map": "org_map",
+    "Processes": "processes",
+    "Pain Points": "pain_points",
+    "Data Sources": "data_sources",
+    "Compliance": "compliance",
+    "Feature Ideas": "feature_ideas",
+    "Reference Library": "reference_library",
+    "Time & Resource Management": "time_resource_management",
+}
+
+_FIELD_KEY_CACHE: Dict[Tuple[str, str], str] = {
+    (prefix, spec.name): sys.intern(f"{prefix}_{normalize_field_key(spec.name)}")
+    for prefix, specs in _PREVIEW_FIELDS_BY_PREFIX.items()
+    for spec in specs
+}
+
 
 class FieldToggleSwitch(QtWidgets.QWidget):
     """Custom toggle switch for section enable/disable"""
@@ -20,9 +367,8 @@ class FieldToggleSwitch(QtWidgets.QWidget):
         self.setFixedSize(50, 24)
         self.setCursor(QtCore.Qt.PointingHandCursor)
 
-        self._animation = QtCore.QPropertyAnimation(self, b"position")
-        self._animation.setDuration(150)
-        self._animation.setEasingCurve(QtCore.QEasingCurve.InOutCubic)
+        # Built on first toggle; most switches are never clicked
+        self._animation = None
 
     def _get_position(self):
         return self.__internal_position
@@ -57,6 +403,10 @@ class FieldToggleSwitch(QtWidgets.QWidget):
         self._enabled = not self._enabled
         start_pos = 2 if self._enabled else 26
         end_pos = 26 if self._enabled else 2
+        if self._animation is None:
+            self._animation = QtCore.QPropertyAnimation(self, b"position")
+            self._animation.setDuration(150)
+            self._animation.setEasingCurve(QtCore.QEasingCurve.InOutCubic)
         self._animation.setStartValue(start_pos)
         self._animation.setEndValue(end_pos)
         self._animation.start()
@@ -72,6 +422,148 @@ class FieldToggleSwitch(QtWidgets.QWidget):
         return self._enabled
 
 
+class RoundedCard(QtWidgets.QFrame):
+    """Preview card frame that paints its rounded background from a cached pixmap.
+
+    The box (margin and 1px border) still comes from CARD_QSS so layouts are
+    unchanged; only the drawing moves out of the stylesheet.
+    """
+
+    MARGINS = QtCore.QMargins(20, 20, 20, 35)
+    RADIUS = 12
+    BACKGROUND = QtGui.QColor("#FFFFFF")
+    BORDER = QtGui.QColor("#E5E7EB")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bg = None
+
+    def resizeEvent(self, event):
+        self._bg = None
+        super().resizeEvent(event)
+
+    def _render_background(self) -> QtGui.QPixmap:
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        path = QtGui.QPainterPath()
+        rect = QtCore.QRectF(self.rect().marginsRemoved(self.MARGINS)).adjusted(0.5, 0.5, -0.5, -0.5)
+        path.addRoundedRect(rect, self.RADIUS, self.RADIUS)
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.fillPath(path, self.BACKGROUND)
+        painter.strokePath(path, QtGui.QPen(self.BORDER, 1))
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        if self._bg is None:
+            self._bg = self._render_background()
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._bg)
+
+
+class FieldInputStub(QtWidgets.QWidget):
+    """Painted stand-in for a form input: a rounded box with placeholder text.
+
+    The preview inputs never take focus or edit text, so one paintEvent replaces
+    a QLabel with its own stylesheet box model.
+    """
+
+    PADDING_X = 10
+    PADDING_Y = 8
+    LINE_HEIGHT = 38
+    TEXTAREA_HEIGHT = 80
+    TEXT_FLAGS = {
+        True: QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft | QtCore.Qt.TextWordWrap,
+        False: QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft,
+    }
+    TEXT_COLOR = QtGui.QColor("#9CA3AF")
+    COLORS = {
+        True: (QtGui.QColor("#FFFFFF"), QtGui.QColor("#E2E8F0")),
+        False: (QtGui.QColor("#F9FAFB"), QtGui.QColor("#E5E7EB")),
+    }
+
+    def __init__(self, text, textarea=False, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._textarea = textarea
+        self._field_enabled = True
+        if textarea:
+            self.setFixedHeight(self.TEXTAREA_HEIGHT)
+        else:
+            self.setMinimumHeight(self.LINE_HEIGHT)
+
+    def setText(self, text):
+        self._text = text
+        self.updateGeometry()
+        self.update()
+
+    def text(self):
+        return self._text
+
+    def setFieldEnabled(self, enabled):
+        self._field_enabled = enabled
+        self.update()
+
+    def _chrome_width(self):
+        # Border and padding on both sides plus the half-"x" indent QLabel uses
+        return 2 * (1 + self.PADDING_X) + self.fontMetrics().horizontalAdvance("x")
+
+    def sizeHint(self):
+        fm = self.fontMetrics()
+        text_width = fm.boundingRect(0, 0, 2000, 2000, QtCore.Qt.AlignLeft, self._text).width()
+        if self._textarea:
+            height = self.TEXTAREA_HEIGHT
+        else:
+            height = max(self.LINE_HEIGHT, fm.height() + 2 * (1 + self.PADDING_Y))
+        return QtCore.QSize(text_width + self._chrome_width(), height)
+
+    def minimumSizeHint(self):
+        if not self._textarea:
+            return self.sizeHint()
+        fm = self.fontMetrics()
+        longest_word = max((fm.horizontalAdvance(word) for word in self._text.split()), default=0)
+        return QtCore.QSize(longest_word + self._chrome_width(), self.TEXTAREA_HEIGHT)
+
+    def _render(self, ratio) -> QtGui.QPixmap:
+        pixmap = QtGui.QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        background, border = self.COLORS[self._field_enabled]
+        painter.setPen(QtGui.QPen(border, 1))
+        painter.setBrush(background)
+        painter.drawRoundedRect(QtCore.QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        painter.setFont(self.font())
+        indent = self.fontMetrics().horizontalAdvance("x") // 2
+        text_rect = self.rect().adjusted(1 + self.PADDING_X + indent, 1 + self.PADDING_Y,
+                                         -(1 + self.PADDING_X), -(1 + self.PADDING_Y))
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(text_rect, self.TEXT_FLAGS[self._textarea], self._text)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        # Rows with the same size, state and text look identical (every disabled row
+        # reads "Not applicable for this project"), so they share one cached pixmap.
+        ratio = self.devicePixelRatioF()
+        key = (f"fieldInputStub:{self.width()}x{self.height()}@{ratio}:"
+               f"{int(self._textarea)}{int(self._field_enabled)}:{self._text}")
+        pixmap = QtGui.QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._render(ratio)
+            QtGui.QPixmapCache.insert(key, pixmap)
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+
+
 class FieldGroupWidget(QtWidgets.QWidget):
     """Widget representing a single field that can be toggled"""
 
@@ -84,10 +576,23 @@ class FieldGroupWidget(QtWidgets.QWidget):
         self.enabled = enabled
         self.required = required
         self.hovered = False
-        cursor = QtCore.Qt.ForbiddenCursor if required else QtCore.Qt.PointingHandCursor
-        self.setCursor(cursor)
+        self._pending_slot = None
+        self.setCursor(_get_field_cursor(required))
         self.setMouseTracking(True)
 
+    def connect_when_shown(self, slot):
+        """Wire toggled to slot on first show; a row that is never shown can't be clicked"""
+        if self.isVisible():
+            self.toggled.connect(slot)
+        else:
+            self._pending_slot = slot
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_slot is not None:
+            self.toggled.connect(self._pending_slot)
+            self._pending_slot = None
+
     def enterEvent(self, event):
         if not self.required:
             self.hovered = True
@@ -105,30 +610,15 @@ class FieldGroupWidget(QtWidgets.QWidget):
 
     def _update_field_state(self):
         if hasattr(self, 'field_label'):
-            if self.enabled:
-                self.field_label.setStyleSheet("""
-                    font-size: 13px; color: #334155; background: transparent;
-                    border: none; margin: 0px; padding: 0px;
-                """)
-            else:
-                self.field_label.setStyleSheet("""
-                    font-size: 13px; color: #9CA3AF; background: transparent;
-                    border: none; margin: 0px; padding: 0px;
-                """)
+            _set_label_color(self.field_label,
+                             FIELD_LABEL_COLOR if self.enabled else FIELD_LABEL_DISABLED_COLOR)
 
         if hasattr(self, 'field_input'):
+            self.field_input.setFieldEnabled(self.enabled)
             if self.enabled:
-                self.field_input.setStyleSheet("""
-                    background: #FFFFFF; border: 1px solid #E2E8F0; border-radius: 8px;
-                    padding: 8px 10px; color: #9CA3AF; margin: 0px;
-                """)
                 if hasattr(self, 'placeholder_text'):
                     self.field_input.setText(self.placeholder_text)
             else:
-                self.field_input.setStyleSheet("""
-                    background: #F9FAFB; border: 1px solid #E5E7EB; border-radius: 8px;
-                    padding: 8px 10px; color: #9CA3AF; margin: 0px;
-                """)
                 self.field_input.setText("Not applicable for this project")
 
     def paintEvent(self, event):
@@ -241,12 +731,22 @@ class ConsolidatedFieldSectionPage(WizardPage):
         self.section_widgets = {}
         self.field_group_states = {}
         self.section_switches = {}
+        self._validate_timer = QtCore.QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(0)
+        self._validate_timer.timeout.connect(self._validate_form)
+        self._field_row_cache: Dict[Tuple[str, str], FieldGroupWidget] = {}
+        self._pending_preview_rebuild = False
+        self._section_content_widgets: Dict[str, QtWidgets.QWidget] = {}
+        self._built_section_content = set()
+        self._seed_field_group_states()
 
         self._setup_ui()
         self._connect_signals()
         self._validate_form()
 
     def _setup_ui(self):
+        self.setStyleSheet(PAGE_QSS)
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(40, 30, 40, 30)
         layout.setSpacing(20)
@@ -267,14 +767,6 @@ class ConsolidatedFieldSectionPage(WizardPage):
 
         title = QtWidgets.QLabel("Field & Section Configuration")
         title.setObjectName("pageTitle")
-        title.setStyleSheet("""
-            #pageTitle {
-                font-size: 24px;
-                font-weight: 600;
-                color: #F9FAFB;
-                margin-bottom: 8px;
-            }
-        """)
 
         description = QtWidgets.QLabel(
             "Configure which sections respondents will complete and customize individual fields within each section. "
@@ -285,14 +777,6 @@ class ConsolidatedFieldSectionPage(WizardPage):
         )
         description.setWordWrap(True)
         description.setObjectName("pageDescription")
-        description.setStyleSheet("""
-            #pageDescription {
-                font-size: 14px;
-                color: #D1D5DB;
-                line-height: 1.5;
-                margin-bottom: 10px;
-            }
-        """)
 
         layout.addWidget(title)
         layout.addWidget(description)
@@ -303,11 +787,15 @@ class ConsolidatedFieldSectionPage(WizardPage):
             section_widget = self._create_section_widget(section_name, section_data)
             self.content_layout.addWidget(section_widget)
             self.section_widgets[section_name] = section_widget
+            if section_data["enabled"] or section_data["required"]:
+                self._ensure_section_content(section_name)
 
         for section_name, section_data in self.sections["optional_sections"].items():
             section_widget = self._create_section_widget(section_name, section_data)
             self.content_layout.addWidget(section_widget)
             self.section_widgets[section_name] = section_widget
+            if section_data["enabled"] or section_data["required"]:
+                self._ensure_section_content(section_name)
 
     def _create_section_widget(self, section_name, section_data) -> QtWidgets.QWidget:
         container = QtWidgets.QWidget()
@@ -319,26 +807,22 @@ class ConsolidatedFieldSectionPage(WizardPage):
         title_bar = self._create_section_title_bar(section_name, section_data)
         layout.addWidget(title_bar)
 
-        content_widget = self._create_section_content(section_name, section_data)
+        content_widget = self._create_section_content()
         layout.addWidget(content_widget)
+        self._section_content_widgets[section_name] = content_widget
 
         content_widget.setVisible(section_data["enabled"] or section_data["required"])
         return container
 
     def _create_section_title_bar(self, section_name, section_data) -> QtWidgets.QWidget:
         title_bar = QtWidgets.QWidget()
+        title_bar.setObjectName("sectionTitleBar")
         layout = QtWidgets.QHBoxLayout(title_bar)
         layout.setContentsMargins(18, 15, 18, 15)
         layout.setSpacing(15)
 
         name_label = QtWidgets.QLabel(section_name)
-        name_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 600;
-            color: #F9FAFB;
-            background: transparent;
-            border: none;
-        """)
+        name_label.setObjectName("sectionName")
         layout.addWidget(name_label, 1)
 
         if not section_data["required"]:
@@ -348,1432 +832,188 @@ class ConsolidatedFieldSectionPage(WizardPage):
             self.section_switches[section_name] = toggle
         else:
             required_label = QtWidgets.QLabel("REQUIRED")
-            required_label.setStyleSheet("""
-                color: #0BE5F5;
-                font-size: 12px;
-                font-weight: bold;
-                background-color: rgba(11, 229, 245, 0.1);
-                padding: 4px 8px;
-                border-radius: 4px;
-                border: none;
-            """)
+            required_label.setObjectName("requiredBadge")
             layout.addWidget(required_label)
 
-        if section_data["required"]:
-            title_bar.setStyleSheet("""
-                background-color: #1A415E;
-                border: none;
-                border-radius: 8px;
-                margin-bottom: 0px;
-            """)
-        else:
-            title_bar.setStyleSheet("""
-                background-color: #1A415E;
-                border-radius: 8px;
-                margin-bottom: 0px;
-            """)
-
         return title_bar
 
-    def _create_section_content(self, section_name, section_data) -> QtWidgets.QWidget:
+    def _seed_field_group_states(self):
+        """Register every preview field up front so hidden sections can build their cards lazily"""
+        for section_name in chain(self.sections["core_sections"], self.sections["optional_sections"]):
+            prefix = _PREVIEW_PREFIX_BY_SECTION.get(section_name)
+            if prefix is None:
+                continue
+            for field_info in _PREVIEW_FIELDS_BY_PREFIX[prefix]:
+                self.field_group_states.setdefault(_FIELD_KEY_CACHE[(prefix, field_info.name)], True)
+
+    def _create_section_content(self) -> QtWidgets.QWidget:
         content = QtWidgets.QWidget()
+        content.setObjectName("sectionContent")
         layout = QtWidgets.QHBoxLayout(content)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
+        return content
+
+    def _ensure_section_content(self, section_name):
+        """Fill a section's content with its description and preview card the first time it is shown"""
+        if section_name in self._built_section_content:
+            return
+        content_widget = self._section_content_widgets.get(section_name)
+        if content_widget is None:
+            return
+        self._built_section_content.add(section_name)
+
+        section_data = self.sections["core_sections"].get(section_name) or self.sections["optional_sections"][section_name]
+        layout = content_widget.layout()
 
         desc_widget = self._create_description_column(section_data["description"])
         layout.addWidget(desc_widget, 1)
 
-        if section_name == "Respondent Info":
-            form_widget = self._create_respondent_form_preview(section_data)
-        elif section_name == "Org Map":
-            form_widget = self._create_org_map_form_preview(section_data)
-        elif section_name == "Processes":
-            form_widget = self._create_processes_form_preview(section_data)
-        elif section_name == "Pain Points":
-            form_widget = self._create_pain_points_form_preview(section_data)
-        elif section_name == "Data Sources":
-            form_widget = self._create_data_sources_form_preview(section_data)
-        elif section_name == "Compliance":
-            form_widget = self._create_compliance_form_preview(section_data)
-        elif section_name == "Feature Ideas":
-            form_widget = self._create_feature_ideas_form_preview(section_data)
-        elif section_name == "Reference Library":
-            form_widget = self._create_reference_library_form_preview(section_data)
-        elif section_name == "Time & Resource Management":
-            form_widget = self._create_time_resource_form_preview(section_data)
+        prefix = _PREVIEW_PREFIX_BY_SECTION.get(section_name)
+        if prefix == "time_resource_management":
+            form_widget = self._create_time_resource_form_preview()
+        elif prefix is not None:
+            form_widget = self._create_form_preview(prefix)
         else:
             form_widget = self._create_generic_form_preview(section_name, section_data)
 
+        # Preview cards are filled with updates and layout off; lay out and paint them once, fully built
+        if form_widget.layout() is not None:
+            form_widget.layout().setEnabled(True)
+        form_widget.setUpdatesEnabled(True)
         layout.addWidget(form_widget, 1)
 
-        content.setStyleSheet("""
-            background-color: #1a1a1a;
-            margin-bottom: 15px;
-        """)
-
-        return content
-
     def _create_description_column(self, description) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
+        widget.setObjectName("descriptionColumn")
         layout = QtWidgets.QVBoxLayout(widget)
         layout.setContentsMargins(20, 20, 20, 20)
 
         purpose_label = QtWidgets.QLabel("Purpose:")
-        purpose_label.setStyleSheet("""
-            color: #F9FAFB;
-            font-size: 16px;
-            font-weight: 600;
-            margin-bottom: 8px;
-            background: transparent;
-            border: none;
-        """)
+        purpose_label.setObjectName("purposeLabel")
         layout.addWidget(purpose_label)
 
         desc_label = QtWidgets.QLabel(description)
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("""
-            color: #D1D5DB;
-            font-size: 14px;
-            line-height: 1.5;
-            background: transparent;
-            border: none;
-        """)
+        desc_label.setObjectName("descriptionLabel")
         layout.addWidget(desc_label)
         layout.addStretch()
 
-        widget.setStyleSheet("""
-            QWidget {
-                background: transparent;
-                border: none;
-            }
-        """)
-
         return widget
 
-    def _create_respondent_form_preview(self, section_data) -> QtWidgets.QWidget:
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Respondent Profile")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel("Please enter basic information about who you are.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
-
-        fields = [
-            {"name": "Full Name", "placeholder": "e.g., Dana Rivera", "required": True},
-            {"name": "Work Email", "placeholder": "dana@company.com", "required": True},
-            {"name": "Department", "placeholder": "e.g., Support", "required": False},
-            {"name": "Role / Title", "placeholder": "Customer Support Lead", "required": False},
-            {"name": "Primary Responsibilities", "placeholder": "Summarize duties & metrics", "required": False,
-             "type": "textarea"}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field(field_info)
-            form_layout.addWidget(field_widget)
-
-        return card
-
-    def _create_individual_field(self, field_info):
-        section_key = normalize_section_key("Respondent Info")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
-
-    def _create_processes_form_preview(self, section_data) -> QtWidgets.QWidget:
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Business Processes")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel("Describe the business processes you regularly perform.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
-
-        fields = [
-            {"name": "Process Name", "placeholder": "e.g., Weekly Sales Report", "required": False},
-            {"name": "Process Description", "placeholder": "Describe the steps involved", "required": False,
-             "type": "textarea"},
-            {"name": "Frequency", "placeholder": "Daily, Weekly, Monthly, etc.", "required": False},
-            {"name": "Time Investment", "placeholder": "How long does this take?", "required": False},
-            {"name": "Screenshots/Attachments", "placeholder": "Supporting documentation", "required": False}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field_processes(field_info)
-            form_layout.addWidget(field_widget)
-
-        return card
-
-    def _create_feature_ideas_form_preview(self, section_data) -> QtWidgets.QWidget:
-        """Create Feature Ideas form preview"""
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Feature Ideas")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel(
-            "Describe automation opportunities by outlining step-by-step implementation processes.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
-
-        fields = [
-            {"name": "Feature Title", "placeholder": "e.g., Automated Email Response System", "required": True},
-            {"name": "Problem Description", "placeholder": "What specific problem does this solve?", "required": True,
-             "type": "textarea"},
-            {"name": "Expected Outcome", "placeholder": "How would you know this automation is working successfully?",
-             "required": True, "type": "textarea"},
-            {"name": "Implementation Steps", "placeholder": "Multi-step process editor with data dependency tracking",
-             "required": False},
-            {"name": "Screenshots/Attachments", "placeholder": "Supporting documentation", "required": False}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field_feature_ideas(field_info)
-            form_layout.addWidget(field_widget)
-
-        return card
-
-    def _create_individual_field_feature_ideas(self, field_info):
-        """Create individual Feature Ideas field with proper styling"""
-        section_key = normalize_section_key("Feature Ideas")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
-
-    def _create_individual_field_processes(self, field_info):
-        section_key = normalize_section_key("Processes")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
-
-    def _create_org_map_form_preview(self, section_data) -> QtWidgets.QWidget:
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Org Context")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel("Please describe where your role is positioned, and your collaborators.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
-
-        fields = [
-            {"name": "Reports To", "placeholder": "Manager name/title", "required": False},
-            {"name": "Peer Teams", "placeholder": "e.g. Sales Ops, QA", "required": False},
-            {"name": "Downstream Consumers", "placeholder": "e.g., Support", "required": False},
-            {"name": "Org Notes", "placeholder": "Key handoffs, dependencies, SLAs", "required": False,
-             "type": "textarea"}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field_org_map(field_info)
-            form_layout.addWidget(field_widget)
-
-        return card
-
-    def _create_pain_points_form_preview(self, section_data) -> QtWidgets.QWidget:
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Pain Points")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel(
-            "Identify areas where time is wasted or errors occur. Add attachments and screenshots for context.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
-
-        fields = [
-            {"name": "Pain Name", "placeholder": "Brief name for this pain point (e.g., Manual data entry delays)",
-             "required": True},
-            {"name": "Impact", "placeholder": "Very Low, Low, Medium, High, Very High", "required": True},
-            {"name": "Frequency", "placeholder": "Randomly, Daily, Weekly, Monthly, Yearly", "required": True},
-            {"name": "Notes", "placeholder": "Describe the issue, downstream effects, and potential workarounds...",
-             "required": True, "type": "textarea"},
-            {"name": "Screenshots/Attachments", "placeholder": "Supporting documentation", "required": False}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field_pain_points(field_info)
-            form_layout.addWidget(field_widget)
-
-        return card
-
-    def _create_data_sources_form_preview(self, section_data) -> QtWidgets.QWidget:
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Data Sources")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel(
-            "Configure connection details for databases, APIs, and other data systems. Credentials will be collected securely after export.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
-
-        fields = [
-            {"name": "Source Name", "placeholder": "Descriptive name for this data source (e.g., Customer Database)",
-             "required": True},
-            {"name": "Connection Type", "placeholder": "Database, API/Web Service, File System, Cloud Service, etc.",
-             "required": True},
-            {"name": "Description", "placeholder": "Describe what data this source contains and how it will be used...",
-             "required": True, "type": "textarea"},
-            {"name": "Screenshots/Attachments", "placeholder": "Supporting documentation", "required": False}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field_data_sources(field_info)
-            form_layout.addWidget(field_widget)
-
-        return card
-
-    def _create_compliance_form_preview(self, section_data) -> QtWidgets.QWidget:
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Compliance Requirements")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
+    def _new_preview_card(self, prefix) -> Tuple[RoundedCard, QtWidgets.QVBoxLayout]:
+        """Create a preview card with its heading, updates and layout held off while it is filled"""
+        card = RoundedCard()
+        card.setObjectName("previewCard")
+        card.setUpdatesEnabled(False)
+        card.setAttribute(QtCore.Qt.WA_DontCreateNativeAncestors, True)
+
+        form_layout = QtWidgets.QVBoxLayout(card)
+        form_layout.setContentsMargins(16, 16, 16, 16)
+        form_layout.setSpacing(8)
+        form_layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
+        form_layout.setEnabled(False)
+
+        title_text, subtitle_text = _PREVIEW_HEADINGS[prefix]
+        title = QtWidgets.QLabel(title_text)
+        title.setObjectName("previewTitle")
         form_layout.addWidget(title)
 
-        subtitle = QtWidgets.QLabel(
-            "Document regulatory requirements, compliance status, and evidence management for your organization.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
+        subtitle = QtWidgets.QLabel(subtitle_text)
+        subtitle.setObjectName("previewSubtitle")
         form_layout.addSpacing(-3)
         form_layout.addWidget(subtitle)
         form_layout.addSpacing(15)
+        return card, form_layout
 
-        fields = [
-            # Organization Context (Required)
-            {"name": "Industry Sector",
-             "placeholder": "e.g., Healthcare, Financial Services, Manufacturing, Technology", "required": True},
-            {"name": "Company Size", "placeholder": "Micro, Small, Medium, Large, Enterprise", "required": True},
-            {"name": "Geographic Scope",
-             "placeholder": "Countries/regions where you operate (e.g., US, EU, Canada, Global)", "required": True},
-            {"name": "Business Activities",
-             "placeholder": "Key business activities that may trigger compliance requirements", "required": True,
-             "type": "textarea"},
-
-            # Individual Requirements (Required)
-            {"name": "Requirement Name", "placeholder": "e.g., GDPR Article 32 - Security of Processing",
-             "required": True},
-            {"name": "Authority/Regulator", "placeholder": "e.g., GDPR, SEC, FDA, OSHA", "required": True},
-
-            # Optional fields for admin control
-            {"name": "Data Types Handled", "placeholder": "Types of data you collect/process", "required": False,
-             "type": "textarea"},
-            {"name": "Third-Party Vendors", "placeholder": "Key vendors that may impact compliance", "required": False,
-             "type": "textarea"},
-            {"name": "Responsible Person", "placeholder": "Name or role responsible for this requirement",
-             "required": False},
-            {"name": "Evidence Required", "placeholder": "Required documentation and evidence", "required": False,
-             "type": "textarea"},
-            {"name": "Status", "placeholder": "Not Assessed, Compliant, Non-Compliant, In Progress", "required": False},
-            {"name": "Risk Level", "placeholder": "Low, Medium, High, Critical", "required": False},
-            {"name": "Notes", "placeholder": "Additional compliance notes, requirements, and considerations...",
-             "required": False, "type": "textarea"},
-            {"name": "Screenshots/Attachments", "placeholder": "Supporting documentation", "required": False}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field_compliance(field_info)
-            form_layout.addWidget(field_widget)
-
+    def _create_form_preview(self, prefix) -> QtWidgets.QWidget:
+        """Create the preview card for a section whose fields are one flat list"""
+        card, form_layout = self._new_preview_card(prefix)
+        for field_info in _PREVIEW_FIELDS_BY_PREFIX[prefix]:
+            form_layout.addWidget(self._create_individual_field(field_info, prefix))
         return card
 
-    def _create_individual_field_compliance(self, field_info):
-        section_key = normalize_section_key("Compliance")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
+    def _create_individual_field(self, field_info: FieldSpec, prefix: str):
+        """Build one toggleable preview field; prefix is the normalized section key"""
+        cache_key = (prefix, field_info.name)
+        cached = self._field_row_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-    def _create_individual_field_pain_points(self, field_info):
-        section_key = normalize_section_key("Pain Points")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
+        full_field_key = _FIELD_KEY_CACHE.get(cache_key)
+        if full_field_key is None:
+            full_field_key = f"{prefix}_{normalize_field_key(field_info.name)}"
 
-        self.field_group_states[full_field_key] = True
+        enabled = self.field_group_states.setdefault(full_field_key, True)
 
         field_widget = FieldGroupWidget(
             full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
+            field_info.name,
+            enabled=enabled,
+            required=field_info.required
         )
-        field_widget.toggled.connect(self._on_field_group_toggled)
+        field_widget.connect_when_shown(self._on_field_group_toggled)
 
         field_layout = QtWidgets.QVBoxLayout(field_widget)
         field_layout.setContentsMargins(8, 8, 8, 8)
         field_layout.setSpacing(6)
+        field_layout.setEnabled(False)
 
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
+        field_label = QtWidgets.QLabel(field_info.label_text)
+        field_label.setObjectName("fieldLabel")
+        field_label.setFont(_get_field_label_font())
+        _set_label_color(field_label, FIELD_LABEL_COLOR)
+        cursor = _get_field_cursor(field_info.required)
         field_label.setCursor(cursor)
         field_layout.addWidget(field_label)
 
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
+        field_input = FieldInputStub(field_info.placeholder, textarea=field_info.type == "textarea")
         field_input.setCursor(cursor)
         field_layout.addWidget(field_input)
+        field_layout.setEnabled(True)
 
         field_widget.field_label = field_label
         field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
+        field_widget.placeholder_text = field_info.placeholder
+        if not enabled:
+            field_widget._update_field_state()
 
+        self._field_row_cache[cache_key] = field_widget
         return field_widget
 
-    def _create_individual_field_data_sources(self, field_info):
-        section_key = normalize_section_key("Data Sources")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
-
-    def _create_individual_field_org_map(self, field_info):
-        section_key = normalize_section_key("Org Map")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
-
-    def _create_processes_form_preview(self, section_data) -> QtWidgets.QWidget:
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Core Processes")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel("Add one process per entry. You can attach documents and capture screenshots.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
-
-        fields = [
-            {"name": "Title", "placeholder": "Process title (e.g., Client Onboarding Workflow)", "required": True},
-            {"name": "Notes", "placeholder": "Briefly describe the steps, systems involved, and expected outcomes.",
-             "required": True, "type": "textarea"},
-            {"name": "Screenshots/Attachments", "placeholder": "Supporting documentation", "required": False}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field_processes(field_info)
-            form_layout.addWidget(field_widget)
-
-        return card
-
-    def _create_individual_field_processes(self, field_info):
-        section_key = normalize_section_key("Processes")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
-
-    def _create_reference_library_form_preview(self, section_data) -> QtWidgets.QWidget:
-        """Create Reference Library form preview"""
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Reference Library")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel(
-            "Central repository for organizational documents, policies, and reference materials.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
-
-        fields = [
-            {"name": "Document Title", "placeholder": "Descriptive title for this document", "required": True},
-            {"name": "File Attachment", "placeholder": "Upload document or capture screenshot", "required": True},
-            {"name": "Category", "placeholder": "Organizational, Process Documentation, Policies & Procedures, etc.",
-             "required": False},
-            {"name": "Description", "placeholder": "Brief description of the document's content and purpose",
-             "required": False, "type": "textarea"},
-            {"name": "Tags", "placeholder": "Keywords for organization and searchability", "required": False}
-        ]
-
-        for field_info in fields:
-            field_widget = self._create_individual_field_reference_library(field_info)
-            form_layout.addWidget(field_widget)
-
-        return card
-
-    def _create_time_resource_form_preview(self, section_data) -> QtWidgets.QWidget:
+    def _create_time_resource_form_preview(self) -> QtWidgets.QWidget:
         """Create Time & Resource Management form preview"""
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            margin: 20px 20px 35px 20px;
-        """)
-
-        card_layout = QtWidgets.QVBoxLayout(card)
-        card_layout.setContentsMargins(16, 16, 16, 16)
-        card_layout.setSpacing(8)
-
-        form_layout = QtWidgets.QVBoxLayout()
-        form_layout.setContentsMargins(0, 0, 0, 0)
-        card_layout.addLayout(form_layout)
-        card_layout.setAlignment(form_layout, QtCore.Qt.AlignmentFlag.AlignTop)
-
-        title = QtWidgets.QLabel("Time & Resource Management")
-        title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color: #1F2937;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addWidget(title)
-
-        subtitle = QtWidgets.QLabel(
-            "Track how you spend your time and identify resource constraints that impact productivity.")
-        subtitle.setStyleSheet("""
-            color: #6B7280;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            margin: 0; padding: 0;
-        """)
-        form_layout.addSpacing(-3)
-        form_layout.addWidget(subtitle)
-        form_layout.addSpacing(15)
+        card, form_layout = self._new_preview_card("time_resource_management")
 
         # Overview Analysis section (required)
-        overview_fields = [
-            {"name": "Primary Activities", "placeholder": "Describe your main work activities and responsibilities",
-             "required": True, "type": "textarea"},
-            {"name": "Peak Workload Periods",
-             "placeholder": "When is your workload most intense? (daily, weekly, monthly patterns)", "required": True,
-             "type": "textarea"},
-            {"name": "Resource Constraints",
-             "placeholder": "What limits your productivity? (tools, information, approvals, etc.)", "required": True,
-             "type": "textarea"},
-            {"name": "Waiting Time", "placeholder": "Time spent waiting for approvals, information, responses, etc.",
-             "required": True, "type": "textarea"},
-            {"name": "Overtime Patterns", "placeholder": "When and why do you work overtime?", "required": True,
-             "type": "textarea"},
-            {"name": "Additional Notes", "placeholder": "Any other time management or resource-related observations",
-             "required": True, "type": "textarea"}
-        ]
-
-        # Add section header for overview
         overview_header = QtWidgets.QLabel("Overview Analysis")
-        overview_header.setStyleSheet("""
-            font-size: 14px;
-            font-weight: 600;
-            color: #374151;
-            background: transparent;
-            border: none;
-            margin: 8px 0px 4px 0px;
-            padding: 0px;
-        """)
+        overview_header.setObjectName("previewSectionHeader")
         form_layout.addWidget(overview_header)
 
-        for field_info in overview_fields:
-            field_widget = self._create_individual_field_time_resource(field_info)
+        for field_info in _TIME_RESOURCE_OVERVIEW_FIELDS:
+            field_widget = self._create_individual_field(field_info, "time_resource_management")
             form_layout.addWidget(field_widget)
 
         # Time Allocation Tracking section (optional)
         form_layout.addSpacing(10)
 
         tracking_header = QtWidgets.QLabel("Time Allocation Tracking")
-        tracking_header.setStyleSheet("""
-            font-size: 14px;
-            font-weight: 600;
-            color: #374151;
-            background: transparent;
-            border: none;
-            margin: 8px 0px 4px 0px;
-            padding: 0px;
-        """)
+        tracking_header.setObjectName("previewSectionHeader")
         form_layout.addWidget(tracking_header)
 
-        tracking_fields = [
-            {"name": "Activity Name", "placeholder": "e.g., Email processing, Report generation", "required": False},
-            {"name": "Hours per Week", "placeholder": "Numeric input with spinner control", "required": False},
-            {"name": "Priority Level", "placeholder": "High, Medium, Low", "required": False},
-            {"name": "Activity Notes", "placeholder": "Additional details about this activity", "required": False,
-             "type": "textarea"},
-            {"name": "Screenshots/Attachments", "placeholder": "Supporting documentation", "required": False}
-        ]
-
-        for field_info in tracking_fields:
-            field_widget = self._create_individual_field_time_resource(field_info)
+        for field_info in _TIME_RESOURCE_TRACKING_FIELDS:
+            field_widget = self._create_individual_field(field_info, "time_resource_management")
             form_layout.addWidget(field_widget)
 
         return card
 
-    def _create_individual_field_time_resource(self, field_info):
-        """Create individual Time & Resource Management field with proper styling"""
-        section_key = normalize_section_key("Time & Resource Management")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
-
-    def _create_individual_field_reference_library(self, field_info):
-        """Create individual Reference Library field with proper styling"""
-        section_key = normalize_section_key("Reference Library")
-        field_key = normalize_field_key(field_info["name"])
-        full_field_key = f"{section_key}_{field_key}"
-
-        self.field_group_states[full_field_key] = True
-
-        field_widget = FieldGroupWidget(
-            full_field_key,
-            field_info["name"],
-            enabled=True,
-            required=field_info["required"]
-        )
-        field_widget.toggled.connect(self._on_field_group_toggled)
-
-        field_layout = QtWidgets.QVBoxLayout(field_widget)
-        field_layout.setContentsMargins(8, 8, 8, 8)
-        field_layout.setSpacing(6)
-
-        label_text = field_info["name"]
-        if field_info["required"]:
-            label_text += " *"
-
-        field_label = QtWidgets.QLabel(label_text)
-        field_label.setStyleSheet("""
-            font-size: 13px; 
-            color: #334155; 
-            background: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        """)
-        cursor = QtCore.Qt.ForbiddenCursor if field_info["required"] else QtCore.Qt.PointingHandCursor
-        field_label.setCursor(cursor)
-        field_layout.addWidget(field_label)
-
-        field_input = QtWidgets.QLabel()
-        field_input.setText(field_info["placeholder"])
-
-        if field_info.get("type") == "textarea":
-            field_input.setMinimumHeight(80)
-            field_input.setMaximumHeight(80)
-            field_input.setWordWrap(True)
-            field_input.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        else:
-            field_input.setMinimumHeight(38)
-            field_input.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-
-        field_input.setStyleSheet("""
-            background: #FFFFFF;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 8px 10px;
-            color: #9CA3AF;
-            margin: 0px;
-        """)
-
-        field_input.setCursor(cursor)
-        field_layout.addWidget(field_input)
-
-        field_widget.field_label = field_label
-        field_widget.field_input = field_input
-        field_widget.placeholder_text = field_info["placeholder"]
-
-        return field_widget
-
     def _create_generic_form_preview(self, section_name, section_data) -> QtWidgets.QWidget:
         widget = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(widget)
 
         placeholder = QtWidgets.QLabel(f"{section_name} form preview\n(To be implemented)")
         placeholder.setAlignment(QtCore.Qt.AlignCenter)
-        placeholder.setStyleSheet("""
-            color: #6B7280;
-            font-style: italic;
-            font-size: 14px;
-            background: #F9FAFB;
-            border: 2px dashed #E5E7EB;
-            border-radius: 8px;
-            padding: 40px;
-            margin: 20px;
-        """)
+        placeholder.setObjectName("genericPreview")
         layout.addWidget(placeholder)
         return widget
 
@@ -1781,21 +1021,47 @@ class ConsolidatedFieldSectionPage(WizardPage):
         pass
 
     def _on_section_toggled(self, section_name, enabled):
-        container = self.section_widgets.get(section_name)
-        if container:
-            content_widget = container.layout().itemAt(1).widget()
+        content_widget = self._section_content_widgets.get(section_name)
+        if content_widget is not None:
+            if enabled:
+                self._ensure_section_content(section_name)
             content_widget.setVisible(enabled)
 
         if section_name in self.sections["optional_sections"]:
             self.sections["optional_sections"][section_name]["enabled"] = enabled
 
-        self._validate_form()
+        self._schedule_validation()
 
     def _on_field_group_toggled(self, field_group_key, enabled):
         self.field_group_states[field_group_key] = enabled
-        self._validate_form()
+        self._schedule_validation()
+
+    def _schedule_preview_rebuild(self):
+        """Queue a sync of the preview rows with field_group_states for the next event loop pass"""
+        if self._pending_preview_rebuild:
+            return
+        self._pending_preview_rebuild = True
+        QtCore.QTimer.singleShot(0, self._flush_preview_rebuild)
+
+    def _flush_preview_rebuild(self):
+        self._pending_preview_rebuild = False
+        self.setUpdatesEnabled(False)
+        try:
+            for field_widget in self._field_row_cache.values():
+                enabled = self.field_group_states.get(field_widget.field_key, True)
+                if field_widget.enabled != enabled:
+                    field_widget.enabled = enabled
+                    field_widget._update_field_state()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
+
+    def _schedule_validation(self):
+        """Coalesce validation requests from toggles into one run per event loop pass"""
+        self._validate_timer.start()
 
     def _validate_form(self):
+        self._validate_timer.stop()
         self.canProceed.emit(True)
 
     def validate_page(self) -> Tuple[bool, str]:
@@ -1807,15 +1073,17 @@ class ConsolidatedFieldSectionPage(WizardPage):
             "field_groups": self.field_group_states.copy()
         }
 
-        all_sections = {**self.sections["core_sections"], **self.sections["optional_sections"]}
-        for section_name, section_config in all_sections.items():
+        enabled_sections = 0
+        all_sections = chain(self.sections["core_sections"].items(), self.sections["optional_sections"].items())
+        for section_name, section_config in all_sections:
+            enabled = section_config["enabled"] or section_config["required"]
+            enabled_sections += enabled
             data["sections"][section_name] = {
-                "enabled": section_config["enabled"] or section_config["required"],
+                "enabled": enabled,
                 "required": section_config["required"]
             }
 
-        enabled_sections = sum(1 for s in data["sections"].values() if s["enabled"])
-        enabled_field_groups = sum(1 for enabled in self.field_group_states.values() if enabled)
+        enabled_field_groups = sum(self.field_group_states.values())
 
         data["summary"] = {
             "total_sections": len(data["sections"]),
@@ -1831,17 +1099,24 @@ class ConsolidatedFieldSectionPage(WizardPage):
         for section_name, section_config in sections_data.items():
             if section_name in self.sections["optional_sections"]:
                 enabled = section_config.get("enabled", False)
+                # Switch and content visibility always follow the config, so a section
+                # restored to its current state needs no widget work at all
+                if self.sections["optional_sections"][section_name]["enabled"] == enabled:
+                    continue
                 self.sections["optional_sections"][section_name]["enabled"] = enabled
 
                 if section_name in self.section_switches:
                     self.section_switches[section_name].setChecked(enabled)
 
-                container = self.section_widgets.get(section_name)
-                if container:
-                    content_widget = container.layout().itemAt(1).widget()
+                content_widget = self._section_content_widgets.get(section_name)
+                if content_widget is not None:
+                    if enabled:
+                        self._ensure_section_content(section_name)
                     content_widget.setVisible(enabled)
 
         field_groups_data = data.get("field_groups", {})
-        self.field_group_states.update(field_groups_data)
+        if any(self.field_group_states.get(key) != value for key, value in field_groups_data.items()):
+            self.field_group_states.update(field_groups_data)
+            self._schedule_preview_rebuild()
 
         self._validate_form()
@@ -3,11 +3,349 @@ Data Sources Configuration Page - Step 3 of Admin Setup Wizard
 Allows admins to define organizational data sources with categories.
 """
 
-from typing import Dict, Any, Tuple, List
+import bisect
+from typing import Dict, Any, Optional, Tuple, List
 from PySide6 import QtWidgets, QtCore, QtGui
 from discovery_assistant.wizard_base import WizardPage
 from discovery_assistant.ui.modals.data_source_modal import DataSourceModal, DataSource
 from discovery_assistant.ui.widgets.warning_widget import WarningWidget
+from discovery_assistant.ui.wizard_pages.page_styles import PAGE_HEADER_QSS, GROUP_QSS
+
+# Category lookups built once rather than per row or per paint
+_CATEGORY_DISPLAY: Dict[str, str] = dict(DataSource.CATEGORIES)
+_CATEGORY_QCOLORS: Dict[str, QtGui.QColor] = {
+    key: QtGui.QColor(value) for key, value in DataSource.CATEGORY_COLORS.items()
+}
+
+BUTTON_QSS = """
+    QLabel#templateHelp {
+        color: #9CA3AF;
+        font-size: 13px;
+    }
+    QPushButton#templateBtn {
+        background-color: #606060;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: 500;
+        font-size: 14px;
+    }
+    QPushButton#templateBtn:hover {
+        background-color: #808080;
+    }
+    QPushButton#addCustomBtn {
+        background-color: #404040;
+        color: #F9FAFB;
+        border: 2px dashed #606060;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: 500;
+        font-size: 14px;
+    }
+    QPushButton#addCustomBtn:hover {
+        background-color: #606060;
+        border-style: solid;
+    }
+"""
+
+TABLE_QSS = """
+    QTableView#sourcesTable {
+        background-color: #383838;
+        border: 1px solid #404040;
+        color: #F9FAFB;
+        alternate-background-color: #444444;
+        gridline-color: #404040;
+    }
+    QTableView#sourcesTable::item {
+        padding: 6px 10px;
+        border-bottom: 1px solid #404040;
+    }
+    QTableView#sourcesTable::item:selected { background-color: #606060; }
+    QTableView#sourcesTable::item:focus { outline: none; }
+
+    QTableView#sourcesTable QHeaderView::section {
+        background-color: #2D2D2D;
+        color: #F9FAFB;
+        padding: 8px 10px;
+        min-height: 30px;
+        border: none;
+        border-bottom: 1px solid #404040;
+        font-weight: 600;
+    }
+    QLabel#sourcesEmptyState {
+        color: #6B7280;
+        font-style: italic;
+        padding: 40px;
+        border: 2px dashed #444444;
+        border-radius: 8px;
+        background-color: #101010;
+    }
+"""
+
+PAGE_QSS = PAGE_HEADER_QSS + GROUP_QSS + BUTTON_QSS + TABLE_QSS
+
+
+class DataSourceTableModel(QtCore.QAbstractTableModel):
+    """Table model over the page's data sources, one row per source.
+
+    The model shares the page's source list and keeps it sorted by category,
+    so rows map directly onto list positions.
+    """
+
+    HEADERS = ("Type", "Specific Name", "Description", "Actions")
+    CATEGORY_ROLE = QtCore.Qt.UserRole
+
+    def __init__(self, sources: List[DataSource], parent=None):
+        super().__init__(parent)
+        self._sources = sources
+        self._display_descs = [self._truncate_description(s.description) for s in sources]  # Parallel to _sources
+
+    def set_sources(self, sources: List[DataSource]):
+        """Wrap a source list that is already sorted by category"""
+        self.beginResetModel()
+        self._sources = sources
+        self._display_descs = [self._truncate_description(s.description) for s in sources]
+        self.endResetModel()
+
+    def source(self, row: int) -> DataSource:
+        return self._sources[row]
+
+    def insert_source(self, source: DataSource) -> int:
+        """Insert a source at its category-sorted position and return its row"""
+        row = bisect.bisect_right(self._sources, source.category, key=lambda s: s.category)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._sources.insert(row, source)
+        self._display_descs.insert(row, self._truncate_description(source.description))
+        self.endInsertRows()
+        return row
+
+    def remove_source(self, row: int) -> DataSource:
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        source = self._sources.pop(row)
+        del self._display_descs[row]
+        self.endRemoveRows()
+        return source
+
+    def source_changed(self, row: int) -> int:
+        """Refresh a source edited in place, moving it if its category changed; return its row"""
+        source = self._sources[row]
+        in_order = ((row == 0 or self._sources[row - 1].category <= source.category)
+                    and (row == len(self._sources) - 1 or source.category <= self._sources[row + 1].category))
+        if not in_order:
+            self.remove_source(row)
+            return self.insert_source(source)
+        self._display_descs[row] = self._truncate_description(source.description)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        return row
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._sources)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        source = self._sources[index.row()]
+        column = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0:
+                return _CATEGORY_DISPLAY.get(source.category, source.category)
+            if column == 1:
+                return source.name
+            if column == 2:
+                return self._display_descs[index.row()]
+        elif role == QtCore.Qt.ToolTipRole and column == 2:
+            return source.description  # Full text on hover
+        elif role == self.CATEGORY_ROLE:
+            return source.category
+        return None
+
+    @staticmethod
+    def _truncate_description(text: str, max_chars: int = 45) -> str:
+        """Truncate description with ellipsis"""
+        if not text:
+            return ""
+        if len(text) <= max_chars:
+            return text
+        return text[:max_chars] + "..."
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class TypeDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints the Type cell as a category color bar followed by the category name"""
+
+    PADDING_H = 10
+    GAP = 8
+    BAR_W = 4
+    BAR_H = 20
+    TEXT_COLOR = QtGui.QColor("#F9FAFB")
+    FALLBACK_COLOR = QtGui.QColor("#777777")
+
+    def paint(self, painter, option, index):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        # Lay out from the full cell; PADDING_H matches the QTableView::item padding in PAGE_QSS
+        rect = option.rect
+        color = _CATEGORY_QCOLORS.get(index.data(DataSourceTableModel.CATEGORY_ROLE), self.FALLBACK_COLOR)
+        bar = QtCore.QRect(rect.left() + self.PADDING_H, rect.center().y() - self.BAR_H // 2,
+                           self.BAR_W, self.BAR_H)
+        text_rect = rect.adjusted(self.PADDING_H + self.BAR_W + self.GAP, 0, -self.PADDING_H, 0)
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(bar, 1, 1)
+        painter.setPen(self.TEXT_COLOR)
+        painter.setFont(opt.font)
+        text = opt.fontMetrics.elidedText(text, QtCore.Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, text)
+        painter.restore()
+
+
+class ActionsDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints Edit and Delete buttons in the Actions cell and reports clicks by row"""
+
+    edit_clicked = QtCore.Signal(int)
+    delete_clicked = QtCore.Signal(int)
+
+    MARGIN_V = 4
+    GAP = 6
+    BUTTON_PADDING_H = 12
+    BUTTON_PADDING_V = 6
+    RADIUS = 6
+    TEXT_COLOR = QtGui.QColor("white")
+    # (label, background, hover background) per button, matching the old
+    # #editBtn and #removeBtn push button styles
+    BUTTONS = (
+        ("Edit", QtGui.QColor("#606060"), QtGui.QColor("#808080")),
+        ("Delete", QtGui.QColor("#808080"), QtGui.QColor("#606060")),
+    )
+
+    # Button font and sizes per base font key, so painting never re-measures
+    _metrics_cache: Dict[str, Tuple[QtGui.QFont, List[QtCore.QSize]]] = {}
+
+    def __init__(self, view: QtWidgets.QAbstractItemView):
+        super().__init__(view)
+        self._view = view
+        self._hover = None  # (row, button index) under the mouse
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    @classmethod
+    def _metrics(cls, font: QtGui.QFont) -> Tuple[QtGui.QFont, List[QtCore.QSize]]:
+        key = font.key()
+        cached = cls._metrics_cache.get(key)
+        if cached is None:
+            button_font = QtGui.QFont(font)
+            button_font.setWeight(QtGui.QFont.Medium)
+            fm = QtGui.QFontMetrics(button_font)
+            height = fm.height() + 2 * cls.BUTTON_PADDING_V
+            sizes = [QtCore.QSize(fm.horizontalAdvance(label) + 2 * cls.BUTTON_PADDING_H, height)
+                     for label, _, _ in cls.BUTTONS]
+            cached = cls._metrics_cache[key] = (button_font, sizes)
+        return cached
+
+    @classmethod
+    def button_font(cls, font: QtGui.QFont) -> QtGui.QFont:
+        return cls._metrics(font)[0]
+
+    @classmethod
+    def button_sizes(cls, font: QtGui.QFont) -> List[QtCore.QSize]:
+        return cls._metrics(font)[1]
+
+    def _button_rects(self, rect: QtCore.QRect, font: QtGui.QFont) -> List[QtCore.QRect]:
+        sizes = self.button_sizes(font)
+        total_w = sum(size.width() for size in sizes) + self.GAP * (len(sizes) - 1)
+        x = rect.left() + (rect.width() - total_w) // 2
+        rects = []
+        for size in sizes:
+            y = rect.top() + (rect.height() - size.height()) // 2
+            rects.append(QtCore.QRect(x, y, size.width(), size.height()))
+            x += size.width() + self.GAP
+        return rects
+
+    def _button_at(self, rect: QtCore.QRect, font: QtGui.QFont, pos: QtCore.QPoint) -> int:
+        for i, button_rect in enumerate(self._button_rects(rect, font)):
+            if button_rect.contains(pos):
+                return i
+        return -1
+
+    def sizeHint(self, option, index):
+        sizes = self.button_sizes(option.font)
+        width = sum(size.width() for size in sizes) + self.GAP * (len(sizes) - 1)
+        return QtCore.QSize(width, max(size.height() for size in sizes) + 2 * self.MARGIN_V)
+
+    def paint(self, painter, option, index):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setFont(self.button_font(option.font))
+        rects = self._button_rects(option.rect, option.font)
+        for i, ((label, background, hover), rect) in enumerate(zip(self.BUTTONS, rects)):
+            hovered = self._hover == (index.row(), i)
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(hover if hovered else background)
+            painter.drawRoundedRect(rect, self.RADIUS, self.RADIUS)
+            painter.setPen(self.TEXT_COLOR)
+            painter.drawText(rect, QtCore.Qt.AlignCenter, label)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QtCore.QEvent.MouseButtonRelease
+                and event.button() == QtCore.Qt.LeftButton):
+            button = self._button_at(option.rect, option.font, event.position().toPoint())
+            if button == 0:
+                self.edit_clicked.emit(index.row())
+                return True
+            if button == 1:
+                self.delete_clicked.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def eventFilter(self, obj, event):
+        """Track the hovered button for hover colors and the pointing-hand cursor"""
+        event_type = event.type()
+        if event_type == QtCore.QEvent.MouseMove:
+            self._set_hover(self._hover_at(event.position().toPoint()))
+        elif event_type == QtCore.QEvent.Leave:
+            self._set_hover(None)
+        return False
+
+    def _hover_at(self, pos: QtCore.QPoint):
+        index = self._view.indexAt(pos)
+        if not index.isValid() or self._view.itemDelegateForIndex(index) is not self:
+            return None
+        button = self._button_at(self._view.visualRect(index), self._view.font(), pos)
+        return (index.row(), button) if button >= 0 else None
+
+    def _set_hover(self, hover):
+        if hover == self._hover:
+            return
+        self._hover = hover
+        viewport = self._view.viewport()
+        if hover is None:
+            viewport.unsetCursor()
+        else:
+            viewport.setCursor(QtCore.Qt.PointingHandCursor)
+        viewport.update()
+
 
 class DataSourcesPage(WizardPage):
     """Step 3: Configure organizational data sources"""
@@ -22,14 +360,22 @@ class DataSourcesPage(WizardPage):
         ("communication", "Team Chat Platform")
     ]
 
+    # Rows hold one line of text and fixed-size painted buttons, so all share one height
+    ROW_HEIGHT = 34
+
     def __init__(self, parent=None):
         super().__init__("Configure Data Sources", parent)
         self.data_sources: List[DataSource] = []
+        self._col_widths: Optional[Dict[int, int]] = None  # Fixed column widths, computed lazily
+        self._table_fm: Optional[QtGui.QFontMetrics] = None
+        self._last_valid: Optional[bool] = None  # Last state sent through canProceed
         self._setup_ui()
         self._connect_signals()
         self._validate_form()
 
     def _setup_ui(self):
+        self.setStyleSheet(PAGE_QSS)
+
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(40, 30, 40, 30)
         layout.setSpacing(20)
@@ -56,14 +402,6 @@ class DataSourcesPage(WizardPage):
         title = QtWidgets.QLabel("Configure Data Sources")
         title.setObjectName("pageTitle")
         title.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-        title.setStyleSheet("""
-            #pageTitle {
-                font-size: 24px;
-                font-weight: 600;
-                color: #F9FAFB;
-                margin-bottom: 8px;
-            }
-        """)
 
         description = QtWidgets.QLabel(
             "<b>Define the data sources your team uses daily.</b> As respondents complete the form, "
@@ -79,14 +417,6 @@ class DataSourcesPage(WizardPage):
         description.setWordWrap(True)
         description.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         description.setObjectName("pageDescription")
-        description.setStyleSheet("""
-            #pageDescription {
-                font-size: 14px;
-                color: #D1D5DB;
-                line-height: 1.5;
-                margin-bottom: 10px;
-            }
-        """)
 
         layout.addWidget(title)
         layout.addWidget(description)
@@ -118,14 +448,14 @@ class DataSourcesPage(WizardPage):
         layout = QtWidgets.QVBoxLayout(group)
         layout.setContentsMargins(18, 15, 18, 15)
         layout.setSpacing(12)
-        self._apply_group_style(group)
+        group.setObjectName("pageGroup")
 
         group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
 
         help_text = QtWidgets.QLabel(
             "Click to quickly add common business data sources:"
         )
-        help_text.setStyleSheet("color: #9CA3AF; font-size: 13px;")
+        help_text.setObjectName("templateHelp")
         layout.addWidget(help_text)
 
         # Create grid of template buttons (3 columns)
@@ -133,16 +463,8 @@ class DataSourcesPage(WizardPage):
         grid.setSpacing(10)
 
         for idx, (category, display_name) in enumerate(self.TEMPLATES):
-            btn = QtWidgets.QPushButton(display_name)
-            btn.setObjectName("templateBtn")
-            btn.setCursor(QtCore.Qt.PointingHandCursor)
-            btn.setFixedHeight(40)
-            btn.clicked.connect(lambda checked, cat=category, name=display_name:
-                                self._open_template_modal(cat, name))
-
-            row = idx // 3
-            col = idx % 3
-            grid.addWidget(btn, row, col)
+            row, col = divmod(idx, 3)
+            grid.addWidget(self._make_template_button(category, display_name), row, col)
 
         layout.addLayout(grid)
 
@@ -156,20 +478,59 @@ class DataSourcesPage(WizardPage):
 
         return group
 
+    def _make_template_button(self, category: str, display_name: str) -> QtWidgets.QPushButton:
+        """Template button styled by PAGE_QSS and dispatched through _on_template_clicked"""
+        btn = QtWidgets.QPushButton(display_name)
+        btn.setObjectName("templateBtn")
+        btn.setCursor(QtCore.Qt.PointingHandCursor)
+        btn.setFixedHeight(40)
+        btn.setProperty("category", category)
+        btn.setProperty("templateName", display_name)
+        btn.clicked.connect(self._on_template_clicked)
+        return btn
+
     def _create_sources_list(self) -> QtWidgets.QGroupBox:
         """Create data sources table"""
         group = QtWidgets.QGroupBox("Your Data Sources")
         layout = QtWidgets.QVBoxLayout(group)
         layout.setContentsMargins(18, 15, 18, 15)
         layout.setSpacing(0)
-        self._apply_group_style(group)
+        group.setObjectName("pageGroup")
 
         group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
 
-        # Table
-        self.sources_table = QtWidgets.QTableWidget()
-        self.sources_table.setColumnCount(4)
-        self.sources_table.setHorizontalHeaderLabels(["Type", "Specific Name", "Description", "Actions"])
+        # The table view is built on first use; pages that never get a source only show the empty state
+        self.sources_model = DataSourceTableModel(self.data_sources, self)
+        self.sources_table: Optional[QtWidgets.QTableView] = None
+        self._sources_layout = layout
+
+        # Empty state
+        self.empty_label = QtWidgets.QLabel(
+            "No data sources configured yet.\n"
+            "Use templates above or add manually below."
+        )
+        self.empty_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.empty_label.setFixedHeight(350)
+        self.empty_label.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        self.empty_label.setObjectName("sourcesEmptyState")
+
+        layout.addWidget(self.empty_label)
+
+        return group
+
+    def _ensure_sources_table(self) -> QtWidgets.QTableView:
+        """Build the sources table view on first use"""
+        if self.sources_table is not None:
+            return self.sources_table
+
+        self.sources_table = QtWidgets.QTableView()
+        self.sources_table.setObjectName("sourcesTable")
+        self.sources_table.setModel(self.sources_model)
+        self.sources_table.setItemDelegateForColumn(0, TypeDelegate(self.sources_table))
+        self.actions_delegate = ActionsDelegate(self.sources_table)
+        self.actions_delegate.edit_clicked.connect(self._open_edit_modal)
+        self.actions_delegate.delete_clicked.connect(self._delete_source)
+        self.sources_table.setItemDelegateForColumn(3, self.actions_delegate)
         self.sources_table.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
 
         # Row selection
@@ -193,103 +554,36 @@ class DataSourcesPage(WizardPage):
         hh.setSectionResizeMode(3, QtWidgets.QHeaderView.Fixed)  # Actions (fixed)
 
         vh = self.sources_table.verticalHeader()
-        vh.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
-        vh.setDefaultSectionSize(34)
+        vh.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        vh.setDefaultSectionSize(self.ROW_HEIGHT)
         vh.setMinimumSectionSize(30)
 
-        self.sources_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #383838;
-                border: 1px solid #404040;
-                color: #F9FAFB;
-                alternate-background-color: #444444;
-                gridline-color: #404040;
-            }
-            QTableWidget::item {
-                padding: 6px 10px;
-                border-bottom: 1px solid #404040;
-            }
-            QTableWidget::item:selected { background-color: #606060; }
-            QTableView::item:focus { outline: none; }
-
-            QHeaderView::section {
-                background-color: #2D2D2D;
-                color: #F9FAFB;
-                padding: 8px 10px;
-                min-height: 30px;
-                border: none;
-                border-bottom: 1px solid #404040;
-                font-weight: 600;
-            }
-        """)
-
+        # Fixed height; longer lists scroll so only visible rows are painted
         self.sources_table.setFixedHeight(350)
+        self.sources_table.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self.sources_table.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
 
-        # Empty state
-        self.empty_label = QtWidgets.QLabel(
-            "No data sources configured yet.\n"
-            "Use templates above or add manually below."
-        )
-        self.empty_label.setAlignment(QtCore.Qt.AlignCenter)
-        self.empty_label.setFixedHeight(350)
-        self.empty_label.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-        self.empty_label.setStyleSheet("""
-            color: #6B7280;
-            font-style: italic;
-            padding: 40px;
-            border: 2px dashed #444444;
-            border-radius: 8px;
-            background-color: #101010;
-        """)
-
-        layout.addWidget(self.sources_table)
-        layout.addWidget(self.empty_label)
-
-        self.sources_table.setVisible(False)
-        self.empty_label.setVisible(True)
-
-        # Set fixed column widths
-        hh.resizeSection(0, self._compute_type_col_width())
-        hh.resizeSection(2, self._compute_description_col_width())
-        hh.resizeSection(3, self._compute_actions_col_width())
-
-        return group
-
-    def _apply_group_style(self, group: QtWidgets.QGroupBox):
-        """Apply consistent group box styling"""
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: 500;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 16px;
-                padding-top: 15px;
-                font-size: 16px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #F9FAFB;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self._sources_layout.insertWidget(0, self.sources_table)
+        return self.sources_table
 
     def _connect_signals(self):
         """Connect signals - intentionally empty as buttons connect in creation"""
         pass
 
+    @QtCore.Slot()
+    def _on_template_clicked(self):
+        """Open the template modal for whichever template button was clicked"""
+        btn = self.sender()
+        self._open_template_modal(btn.property("category"), btn.property("templateName"))
+
     def _open_template_modal(self, category: str, generic_name: str):
         """Open modal with template preset"""
         modal = DataSourceModal(self, preset_category=category, preset_name=generic_name)
         if modal.exec() == QtWidgets.QDialog.Accepted:
             source = modal.get_source()
             source.id = len(self.data_sources) + 1
-            self.data_sources.append(source)
-            self._refresh_sources_table()
-            self._validate_form()
+            self.sources_model.insert_source(source)  # Inserts into self.data_sources in category order
+            self._update_table_chrome()
 
     def _open_add_modal(self):
         """Open modal for custom source"""
@@ -297,146 +591,77 @@ class DataSourcesPage(WizardPage):
         if modal.exec() == QtWidgets.QDialog.Accepted:
             source = modal.get_source()
             source.id = len(self.data_sources) + 1
-            self.data_sources.append(source)
-            self._refresh_sources_table()
-            self._validate_form()
+            self.sources_model.insert_source(source)  # Inserts into self.data_sources in category order
+            self._update_table_chrome()
 
     def _open_edit_modal(self, row: int):
-        """Open modal to edit existing source"""
-        if row < 0 or row >= len(self.data_sources):
+        """Open modal to edit the source shown in the given table row"""
+        if row < 0 or row >= self.sources_model.rowCount():
             return
 
-        source = self.data_sources[row]
+        source = self.sources_model.source(row)
         modal = DataSourceModal(self, source=source)
         if modal.exec() == QtWidgets.QDialog.Accepted:
             # Source was modified in place
-            self._refresh_sources_table()
+            self.sources_model.source_changed(row)
 
     def _refresh_sources_table(self):
-        """Refresh the sources table display"""
-        tbl = self.sources_table
-        tbl.setRowCount(0)
-
-        if not self.data_sources:
-            tbl.setVisible(False)
-            self.empty_label.setVisible(True)
-            return
+        """Rebuild the sources table from self.data_sources"""
+        self.sources_model.set_sources(self.data_sources)
+        self._update_table_chrome()
+
+    def _update_table_chrome(self):
+        """Sync empty state, column widths and page validity with the source count"""
+        has_sources = bool(self.data_sources)
+        if has_sources:
+            self._ensure_sources_table().setVisible(True)
+            # Reassert fixed widths
+            self._apply_column_widths()
+        elif self.sources_table is not None:
+            self.sources_table.setVisible(False)
+        self.empty_label.setVisible(not has_sources)
+
+        self._validate_form(has_sources)
+
+    def _column_widths(self) -> Dict[int, int]:
+        """Fixed column widths by column index, cached until the font or style changes"""
+        if self._col_widths is None:
+            self._col_widths = {
+                0: self._compute_type_col_width(),
+                2: self._compute_description_col_width(),
+                3: self._compute_actions_col_width(),
+            }
+        return self._col_widths
 
-        tbl.setVisible(True)
-        self.empty_label.setVisible(False)
-
-        # Sort sources by category for grouped display
-        sorted_sources = sorted(self.data_sources, key=lambda s: s.category)
-
-        PADDING_H = 10
-        GAP = 8
-
-        for row, source in enumerate(sorted_sources):
-            tbl.insertRow(row)
-
-            category_key = source.category
-            name = source.name
-            description = source.description
-
-            # Get display name and color for category
-            category_display = next((disp for key, disp in DataSource.CATEGORIES if key == category_key), category_key)
-            category_color = DataSource.CATEGORY_COLORS.get(category_key, "#777777")
-
-            # --- Type cell (color bar + label) ---
-            type_widget = QtWidgets.QWidget()
-            type_layout = QtWidgets.QHBoxLayout(type_widget)
-            type_layout.setContentsMargins(PADDING_H, 0, PADDING_H, 0)
-            type_layout.setSpacing(GAP)
-
-            color_indicator = QtWidgets.QLabel()
-            color_indicator.setFixedSize(4, 20)
-            color_indicator.setStyleSheet(f"background:{category_color}; border-radius:1px;")
-
-            type_label = QtWidgets.QLabel(category_display)
-            type_label.setStyleSheet("color: #F9FAFB;")
-
-            type_layout.addWidget(color_indicator, 0, QtCore.Qt.AlignVCenter)
-            type_layout.addWidget(type_label, 0, QtCore.Qt.AlignVCenter)
-            type_layout.addStretch()
-
-            type_widget.setMinimumHeight(max(type_label.sizeHint().height(), 20) + 6)
-            type_widget.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
-            tbl.setCellWidget(row, 0, type_widget)
-
-            # --- Specific Name ---
-            name_item = QtWidgets.QTableWidgetItem(name)
-            name_item.setFlags(name_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            tbl.setItem(row, 1, name_item)
-
-            # --- Description (truncated) ---
-            truncated_desc = self._truncate_description(description)
-            desc_item = QtWidgets.QTableWidgetItem(truncated_desc)
-            desc_item.setFlags(desc_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            desc_item.setToolTip(description)  # Full text on hover
-            tbl.setItem(row, 2, desc_item)
-
-            # --- Actions (Edit + Delete) ---
-            actions_widget = QtWidgets.QWidget()
-            h = QtWidgets.QHBoxLayout(actions_widget)
-            h.setContentsMargins(10, 4, 10, 4)
-            h.setSpacing(6)
-            h.setAlignment(QtCore.Qt.AlignCenter)
-
-            edit_btn = QtWidgets.QPushButton("Edit")
-            edit_btn.setObjectName("editBtn")
-            edit_btn.setCursor(QtCore.Qt.PointingHandCursor)
-            edit_btn.clicked.connect(lambda _, r=row: self._open_edit_modal(r))
-
-            delete_btn = QtWidgets.QPushButton("Delete")
-            delete_btn.setObjectName("removeBtn")
-            delete_btn.setCursor(QtCore.Qt.PointingHandCursor)
-            delete_btn.clicked.connect(lambda _, r=row: self._delete_source(r))
-
-            h.addWidget(edit_btn)
-            h.addWidget(delete_btn)
-
-            actions_widget.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
-            tbl.setCellWidget(row, 3, actions_widget)
-
-        # Resize rows to fit content
-        tbl.resizeRowsToContents()
-
-        # Reassert fixed widths
-        hh = tbl.horizontalHeader()
-        hh.resizeSection(0, self._compute_type_col_width())
-        hh.resizeSection(2, self._compute_description_col_width())
-        hh.resizeSection(3, self._compute_actions_col_width())
-
-        # Adjust table height to content
-        header_h = hh.height()
-        rows_h = sum(tbl.rowHeight(r) for r in range(tbl.rowCount()))
-        hbar_h = tbl.horizontalScrollBar().height() if tbl.horizontalScrollBar().isVisible() else 0
-        frame = 2 * tbl.frameWidth()
-        required = header_h + rows_h + hbar_h + frame
-        tbl.setFixedHeight(max(350, required))
-
-    def _truncate_description(self, text: str, max_chars: int = 45) -> str:
-        """Truncate description with ellipsis"""
-        if not text:
-            return ""
-        if len(text) <= max_chars:
-            return text
-        return text[:max_chars] + "..."
+    def _apply_column_widths(self):
+        hh = self.sources_table.horizontalHeader()
+        for column, width in self._column_widths().items():
+            hh.resizeSection(column, width)
+
+    def changeEvent(self, event):
+        """Drop cached column widths and font metrics when font or style changes"""
+        super().changeEvent(event)
+        if event.type() in (QtCore.QEvent.FontChange, QtCore.QEvent.StyleChange):
+            self._col_widths = None
+            self._table_fm = None
+
+    def _font_metrics(self) -> QtGui.QFontMetrics:
+        """Font metrics for the sources table font, cached until the font changes"""
+        if self._table_fm is None:
+            self._table_fm = QtGui.QFontMetrics(self.sources_table.font())
+        return self._table_fm
 
     def _compute_type_col_width(self) -> int:
-        """Fixed width for Type column"""
-        PADDING_H = 10
-        GAP = 8
-        BAR_W = 4
+        """Fixed width for Type column, sized so the widest category name is never elided"""
         EXTRA = 6
-        fm = QtGui.QFontMetrics(self.sources_table.font())
-        widest_label = "Project Management System"
-        text_w = fm.horizontalAdvance(widest_label)
-        return PADDING_H + BAR_W + GAP + text_w + PADDING_H + EXTRA
+        fm = self._font_metrics()
+        text_w = max(fm.horizontalAdvance(label) for label in _CATEGORY_DISPLAY.values())
+        d = TypeDelegate
+        return d.PADDING_H + d.BAR_W + d.GAP + text_w + d.PADDING_H + EXTRA
 
     def _compute_description_col_width(self) -> int:
         """Fixed width for Description column (45 chars + ellipsis)"""
-        fm = QtGui.QFontMetrics(self.sources_table.font())
+        fm = self._font_metrics()
         sample = "X" * 45 + "..."
         text_w = fm.horizontalAdvance(sample)
         PADDING = 20
@@ -444,14 +669,9 @@ class DataSourcesPage(WizardPage):
 
     def _compute_actions_col_width(self) -> int:
         """Fixed width for Actions column (Edit + Delete buttons)"""
-        # Create temp buttons to measure
-        edit_btn = QtWidgets.QPushButton("Edit")
-        delete_btn = QtWidgets.QPushButton("Delete")
-        edit_btn.setFont(self.sources_table.font())
-        delete_btn.setFont(self.sources_table.font())
-
-        edit_w = edit_btn.sizeHint().width()
-        delete_w = delete_btn.sizeHint().width()
+        # Measure the painted buttons rather than constructing throwaway widgets
+        edit_w, delete_w = (size.width() for size in
+                            ActionsDelegate.button_sizes(self.sources_table.font()))
 
         GAP = 6  # spacing between buttons
         LEFT_RIGHT = 10  # margins
@@ -460,107 +680,60 @@ class DataSourcesPage(WizardPage):
         return edit_w + delete_w + GAP + (LEFT_RIGHT * 2) + EXTRA
 
     def _delete_source(self, row: int):
-        """Delete a data source with confirmation"""
-        if row < 0 or row >= len(self.data_sources):
+        """Delete the data source shown in the given table row, with confirmation"""
+        if row < 0 or row >= self.sources_model.rowCount():
             return
 
-        source_name = self.data_sources[row].name
+        source = self.sources_model.source(row)
 
-        confirm = QtWidgets.QMessageBox.question(
-            self,
+        # Window-modal confirmation via open() so no nested event loop is spun
+        box = QtWidgets.QMessageBox(
+            QtWidgets.QMessageBox.Question,
             "Delete Data Source?",
-            f"Are you sure you want to delete '{source_name}'?\nThis action cannot be undone.",
+            f"Are you sure you want to delete '{source.name}'?\nThis action cannot be undone.",
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-            QtWidgets.QMessageBox.No
+            self
+        )
+        box.setDefaultButton(QtWidgets.QMessageBox.No)
+        box.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        box.finished.connect(
+            lambda _result: self._finish_delete(source)
+            if box.standardButton(box.clickedButton()) == QtWidgets.QMessageBox.Yes else None
         )
+        box.open()
 
-        if confirm != QtWidgets.QMessageBox.Yes:
+    def _finish_delete(self, source: DataSource):
+        """Remove a source once its deletion has been confirmed"""
+        if source not in self.data_sources:
             return
+        row = self.data_sources.index(source)  # Model rows are positions in data_sources
 
         # Store scroll position and selection
         tbl = self.sources_table
         vsb = tbl.verticalScrollBar()
         scroll_pos = vsb.value() if vsb else 0
-        next_select = min(row, tbl.rowCount() - 2)
+        next_select = min(row, self.sources_model.rowCount() - 2)
 
         # Delete source
-        del self.data_sources[row]
-
-        # Refresh table
-        self._refresh_sources_table()
+        self.sources_model.remove_source(row)
+        self._update_table_chrome()
 
         # Restore scroll and selection
         if vsb:
             vsb.setValue(scroll_pos)
-        if 0 <= next_select < tbl.rowCount():
-            tbl.setCurrentCell(next_select, 0)
-
-        self._validate_form()
-
-    def _validate_form(self):
-        """Validate that at least one source exists"""
-        is_valid = len(self.data_sources) > 0
+        if 0 <= next_select < self.sources_model.rowCount():
+            tbl.setCurrentIndex(self.sources_model.index(next_select, 0))
+
+    def _validate_form(self, is_valid: Optional[bool] = None):
+        """Validate that at least one source exists, signalling only when that changes"""
+        if is_valid is None:
+            is_valid = bool(self.data_sources)
+        if is_valid == self._last_valid:
+            return
+        self._last_valid = is_valid
         self.warning_widget.setVisible(not is_valid)
         self.canProceed.emit(is_valid)
 
-    def showEvent(self, event):
-        """Apply input styles when page becomes visible"""
-        super().showEvent(event)
-        self._apply_input_styles()
-
-    def _apply_input_styles(self):
-        """Apply consistent button styling"""
-        button_style = """
-            QPushButton#templateBtn {
-                background-color: #606060;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-                font-size: 14px;
-            }
-            QPushButton#templateBtn:hover {
-                background-color: #808080;
-            }
-            QPushButton#addCustomBtn {
-                background-color: #404040;
-                color: #F9FAFB;
-                border: 2px dashed #606060;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-                font-size: 14px;
-            }
-            QPushButton#addCustomBtn:hover {
-                background-color: #606060;
-                border-style: solid;
-            }
-            QPushButton#editBtn {
-                background-color: #606060;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: 500;
-            }
-            QPushButton#editBtn:hover {
-                background-color: #808080;
-            }
-            QPushButton#removeBtn {
-                background-color: #808080;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: 500;
-            }
-            QPushButton#removeBtn:hover {
-                background-color: #606060;
-            }
-        """
-        self.setStyleSheet(self.styleSheet() + button_style)
-
     # WizardPage interface implementation
     def validate_page(self) -> Tuple[bool, str]:
         if len(self.data_sources) == 0:
@@ -575,6 +748,16 @@ class DataSourcesPage(WizardPage):
 
     def load_data(self, data: Dict[str, Any]) -> None:
         sources_data = data.get("data_sources", [])
-        self.data_sources = [DataSource.from_dict(s) for s in sources_data]
-        self._refresh_sources_table()
-        self._validate_form()
+        # Sort once by category for grouped display; later edits keep the order
+        self.data_sources = sorted((DataSource.from_dict(s) for s in sources_data), key=lambda s: s.category)
+
+        # One model reset and one repaint for the whole list
+        self.setUpdatesEnabled(False)
+        if self.sources_table is not None:
+            self.sources_table.blockSignals(True)
+        try:
+            self._refresh_sources_table()
+        finally:
+            if self.sources_table is not None:
+                self.sources_table.blockSignals(False)
+            self.setUpdatesEnabled(True)
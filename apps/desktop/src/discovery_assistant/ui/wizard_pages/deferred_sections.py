@@ -0,0 +1,60 @@
+"""
+Deferred Wizard Page Sections
+Builds a page's lower sections one per idle tick instead of all at construction.
+"""
+
+from typing import Callable, List
+from PySide6 import QtWidgets, QtCore
+
+
+class DeferredSectionsMixin:
+    """
+    Mixin for WizardPage subclasses whose lower sections are built after construction.
+
+    While building its UI the page sets ``self._content_layout`` and fills
+    ``self._pending_sections`` with section builder callables, in display order,
+    then calls ``_start_deferred_sections``. Each builder runs on its own idle
+    tick; anything still pending is built synchronously before the page is
+    shown, or when ``_ensure_sections`` is called ahead of touching section widgets.
+    """
+
+    _pending_sections: List[Callable[[], QtWidgets.QWidget]]
+    _content_layout: QtWidgets.QBoxLayout
+
+    def _start_deferred_sections(self):
+        self._section_timer = QtCore.QTimer(self)
+        self._section_timer.setSingleShot(True)
+        self._section_timer.setInterval(0)
+        self._section_timer.timeout.connect(self._build_next_section)
+        self._section_timer.start()
+
+    @QtCore.Slot()
+    def _build_next_section(self):
+        """Build one deferred section, then yield to the event loop before the next"""
+        if not self._pending_sections:
+            return
+        self._add_section(self._pending_sections.pop(0)())
+        if self._pending_sections:
+            self._section_timer.start()
+        else:
+            self._on_sections_built()
+
+    def _ensure_sections(self):
+        """Build any sections still pending; needed before touching their widgets"""
+        while self._pending_sections:
+            self._build_next_section()
+        self._section_timer.stop()
+
+    def _add_section(self, section: QtWidgets.QWidget):
+        """Append a built section to the content layout; override to place it elsewhere"""
+        self._content_layout.addWidget(section)
+        section.ensurePolished()
+
+    def _on_sections_built(self):
+        """Called once the last deferred section has been built"""
+        pass
+
+    def showEvent(self, event):
+        """Finish any deferred sections before the page is first painted"""
+        self._ensure_sections()
+        super().showEvent(event)
@@ -0,0 +1,38 @@
+"""
+Shared Wizard Page Styles
+Header and group box rules common to the admin wizard pages.
+"""
+
+PAGE_HEADER_QSS = """
+    QLabel#pageTitle {
+        font-size: 24px;
+        font-weight: 600;
+        color: #F9FAFB;
+        margin-bottom: 8px;
+    }
+    QLabel#pageDescription {
+        font-size: 14px;
+        color: #D1D5DB;
+        line-height: 1.5;
+        margin-bottom: 10px;
+    }
+"""
+
+GROUP_QSS = """
+    QGroupBox#pageGroup {
+        font-weight: 500;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        margin-top: 16px;
+        padding-top: 15px;
+        font-size: 16px;
+    }
+    QGroupBox#pageGroup::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        color: #F9FAFB;
+        font-size: 16px;
+        font-weight: bold;
+    }
+"""
@@ -3,13 +3,140 @@ Privacy & Data Settings Page - Step 6 of Admin Setup Wizard
 Configures AI credits, privacy options, and service engagement preferences.
 """
 
-from typing import Dict, Any, Tuple
+import re
+from typing import Dict, Any, List, Tuple
 from PySide6 import QtWidgets, QtCore, QtGui
 from discovery_assistant.wizard_base import WizardPage
 from discovery_assistant.ui.widgets.warning_widget import WarningWidget
 from discovery_assistant.ui.widgets.styled_checkbox import StyledCheckBox
+from discovery_assistant.ui.wizard_pages.page_styles import PAGE_HEADER_QSS, GROUP_QSS
+from discovery_assistant.ui.wizard_pages.deferred_sections import DeferredSectionsMixin
+
+# Exclusion entries are separated by newlines and/or commas
+_EXCLUSION_SPLIT = re.compile(r"[\n,]+")
+
+# Basic shape check for the contact email: local@domain.tld, no spaces
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+LABEL_QSS = """
+    QLabel#sectionDesc {
+        color: #D1D5DB;
+        font-size: 13px;
+        line-height: 1.4;
+    }
+    QLabel#creditInfo {
+        color: #9CA3AF;
+        font-size: 12px;
+        font-family: 'Courier New';
+    }
+    QLabel#fieldLabel {
+        color: #F9FAFB;
+        font-weight: 500;
+    }
+    QLabel#creditsNote {
+        color: #6B7280;
+        font-size: 11px;
+        font-style: italic;
+        margin-left: 10px;
+    }
+    QLabel#securityInfo {
+        background-color: #2A2A2A;
+        border: 1px solid #404040;
+        border-radius: 6px;
+        padding: 10px;
+        color: #9CA3AF;
+        font-size: 12px;
+    }
+    QLabel#questionLabel {
+        color: #D1D5DB;
+        font-weight: 500;
+        margin-bottom: 8px;
+    }
+    QLabel#advisorNote {
+        color: #9CA3AF;
+        font-size: 12px;
+        font-style: italic;
+        margin-top: 8px;
+    }
+    QLabel#serviceDesc {
+        color: #D1D5DB;
+        margin-bottom: 8px;
+    }
+    QLabel#requirementsNote {
+        color: #9CA3AF;
+        font-size: 12px;
+        margin-top: 8px;
+    }
+    QLabel#anonymizeDesc {
+        color: #9CA3AF;
+        font-size: 12px;
+        margin-left: 25px;
+    }
+"""
+
+INPUT_QSS = """
+    QLineEdit {
+        background-color: #404040;
+        border: 1px solid #606060;
+        border-radius: 6px;
+        padding: 8px 12px;
+        color: #F9FAFB;
+        font-size: 14px;
+    }
+    QLineEdit:focus {
+        border-color: #808080;
+        background-color: #606060;
+    }
+    QPlainTextEdit {
+        background-color: #404040;
+        border: 1px solid #606060;
+        border-radius: 6px;
+        padding: 8px 12px;
+        color: #F9FAFB;
+        font-size: 14px;
+    }
+    QPlainTextEdit:focus {
+        border-color: #808080;
+        background-color: #606060;
+    }
+    QComboBox {
+        padding: 8px 12px;
+    }
+"""
+
+RADIO_QSS = """
+    QRadioButton {
+        color: #F9FAFB;
+        spacing: 8px;
+    }
+    QRadioButton::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 10px;
+        border: 2px solid #606060;
+        background-color: #404040;
+    }
+    QRadioButton::indicator:checked {
+        border: 2px solid #0BE5F5;  /* Blue border when selected */
+        background-color: #0BE5F5;  /* Blue fill when selected */
+    }
+    QRadioButton::indicator:unchecked {
+        border: 2px solid #606060;  /* Gray border when not selected */
+        background-color: #404040;  /* Dark gray fill when not selected */
+    }
+    QRadioButton::indicator:hover {
+        border-color: #808080;
+    }
+    QRadioButton#wizardRadio {
+        color: #F9FAFB;
+        padding: 4px;
+    }
+"""
 
-class PrivacyDataPage(WizardPage):
+PAGE_QSS = PAGE_HEADER_QSS + GROUP_QSS + LABEL_QSS + INPUT_QSS + RADIO_QSS
+
+
+class PrivacyDataPage(DeferredSectionsMixin, WizardPage):
     """Step 6: Privacy, AI credits, and service configuration"""
 
     CREDIT_PACKAGES = [
@@ -38,6 +165,11 @@ class PrivacyDataPage(WizardPage):
         ("no", "No - Internal planning only"),
     ]
 
+    # service_group ids (indexes into SERVICE_INTEREST) that require a contact email
+    _EMAIL_SERVICE_IDS = frozenset(
+        idx for idx, (value, _) in enumerate(SERVICE_INTEREST) if value in ("yes", "maybe")
+    )
+
     COMPANY_SIZES = [
         "1-10 employees",
         "11-50 employees",
@@ -47,11 +179,25 @@ class PrivacyDataPage(WizardPage):
 
     def __init__(self, parent=None):
         super().__init__("Privacy & Data Settings", parent)
+
+        # Email validation runs once typing pauses rather than on every keystroke
+        self._validate_timer = QtCore.QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self._validate_form)
+
+        # Last visibility applied to the contact form; toggled fires for both radios of a flip
+        self._contact_visible = None
+
+        # Set by load_data so its widget updates don't each re-run visibility and validation
+        self._loading = False
+
         self._setup_ui()
-        self._connect_signals()
-        self._validate_form()
+        self._start_deferred_sections()
 
     def _setup_ui(self):
+        self.setStyleSheet(PAGE_QSS)
+
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(40, 30, 40, 30)
         layout.setSpacing(20)
@@ -62,9 +208,14 @@ class PrivacyDataPage(WizardPage):
 
         # Main content
         content_widget = self._create_content_area()
-        layout.addWidget(content_widget, 1)
+        layout.addWidget(content_widget)
         layout.addStretch(1)
 
+        # Apply the page stylesheet now rather than in a burst on first show;
+        # ensurePolished() recurses into children. Deferred sections are
+        # polished as they are built.
+        self.ensurePolished()
+
     def _create_header(self) -> QtWidgets.QVBoxLayout:
         layout = QtWidgets.QVBoxLayout()
         layout.setSpacing(10)
@@ -72,14 +223,6 @@ class PrivacyDataPage(WizardPage):
         title = QtWidgets.QLabel("Privacy & Data Settings")
         title.setObjectName("pageTitle")
         title.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-        title.setStyleSheet("""
-            #pageTitle {
-                font-size: 24px;
-                font-weight: 600;
-                color: #F9FAFB;
-                margin-bottom: 8px;
-            }
-        """)
 
         description = QtWidgets.QLabel(
             "Configure AI analysis credits, advisor availability, and privacy options. "
@@ -89,14 +232,6 @@ class PrivacyDataPage(WizardPage):
         description.setWordWrap(True)
         description.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         description.setObjectName("pageDescription")
-        description.setStyleSheet("""
-            #pageDescription {
-                font-size: 14px;
-                color: #D1D5DB;
-                line-height: 1.5;
-                margin-bottom: 10px;
-            }
-        """)
 
         layout.addWidget(title)
         layout.addWidget(description)
@@ -114,30 +249,46 @@ class PrivacyDataPage(WizardPage):
         ai_config_group = self._create_ai_config_section()
         layout.addWidget(ai_config_group)
 
-        # Section 2: AI Advisor Access
-        advisor_group = self._create_advisor_access_section()
-        layout.addWidget(advisor_group)
-
-        # Section 3: Credit Depletion
-        depletion_group = self._create_depletion_policy_section()
-        layout.addWidget(depletion_group)
-
-        # Section 4: Service Engagement
-        service_group = self._create_service_engagement_section()
-        layout.addWidget(service_group)
-
-        # Section 5: Privacy Options
-        privacy_group = self._create_privacy_options_section()
-        layout.addWidget(privacy_group)
+        # Sections 2-5 (advisor access, credit depletion, service engagement,
+        # privacy options) are appended in this order as deferred sections
+        self._content_layout = layout
+        self._pending_sections = [
+            self._create_advisor_access_section,
+            self._create_depletion_policy_section,
+            self._create_service_engagement_section,
+            self._create_privacy_options_section,
+        ]
 
         return widget
 
-    def _create_ai_config_section(self) -> QtWidgets.QGroupBox:
-        group = QtWidgets.QGroupBox("AI Analysis && Credit System")
+    def _on_sections_built(self):
+        self._connect_signals()
+
+    def _create_group(self, title: str, spacing: int) -> Tuple[QtWidgets.QGroupBox, QtWidgets.QVBoxLayout]:
+        """Create a section group box and its inner layout"""
+        group = QtWidgets.QGroupBox(title)
+        group.setObjectName("pageGroup")
         layout = QtWidgets.QVBoxLayout(group)
         layout.setContentsMargins(18, 15, 18, 15)
-        layout.setSpacing(12)
-        self._apply_group_style(group)
+        layout.setSpacing(spacing)
+        return group, layout
+
+    def _add_radio_options(self, layout: QtWidgets.QVBoxLayout, options: List[Tuple[str, str]],
+                           default: str) -> Tuple[Dict[str, QtWidgets.QRadioButton], QtWidgets.QButtonGroup]:
+        """Add one radio per (value, label) option; button ids are indexes into options"""
+        buttons = {}
+        button_group = QtWidgets.QButtonGroup(self)
+        for idx, (value, display) in enumerate(options):
+            radio = QtWidgets.QRadioButton(display)
+            radio.setObjectName("wizardRadio")
+            buttons[value] = radio
+            button_group.addButton(radio, idx)
+            layout.addWidget(radio)
+        buttons[default].setChecked(True)
+        return buttons, button_group
+
+    def _create_ai_config_section(self) -> QtWidgets.QGroupBox:
+        group, layout = self._create_group("AI Analysis && Credit System", 12)
 
         # Description
         desc = QtWidgets.QLabel(
@@ -149,8 +300,8 @@ class PrivacyDataPage(WizardPage):
             "• Data source connection recommendations\n"
             "• Final report generation with automation opportunity analysis"
         )
+        desc.setObjectName("sectionDesc")
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #D1D5DB; font-size: 13px; line-height: 1.4;")
         layout.addWidget(desc)
 
         layout.addSpacing(8)
@@ -163,8 +314,8 @@ class PrivacyDataPage(WizardPage):
             "• Real-time validation: ~$0.10-0.50 per analysis\n"
             "• Final report generation: ~$5-15 (depending on data volume)"
         )
+        credit_info.setObjectName("creditInfo")
         credit_info.setWordWrap(True)
-        credit_info.setStyleSheet("color: #9CA3AF; font-size: 12px; font-family: 'Courier New';")
         layout.addWidget(credit_info)
 
         layout.addSpacing(8)
@@ -172,12 +323,14 @@ class PrivacyDataPage(WizardPage):
         # Additional credits dropdown
         credits_layout = QtWidgets.QHBoxLayout()
         credits_label = QtWidgets.QLabel("Purchase additional credits now:")
-        credits_label.setStyleSheet("color: #F9FAFB; font-weight: 500;")
+        credits_label.setObjectName("fieldLabel")
 
         self.credits_combo = QtWidgets.QComboBox()
         self.credits_combo.setFixedHeight(35)
-        for amount, desc in self.CREDIT_PACKAGES:
-            self.credits_combo.addItem(desc, amount)
+        amounts, labels = zip(*self.CREDIT_PACKAGES)
+        self.credits_combo.addItems(labels)
+        for i, amount in enumerate(amounts):
+            self.credits_combo.setItemData(i, amount)
         self.credits_combo.setMinimumWidth(300)
 
         credits_layout.addWidget(credits_label)
@@ -189,7 +342,7 @@ class PrivacyDataPage(WizardPage):
         info_note = QtWidgets.QLabel(
             "(Credits can also be added during discovery if needed)"
         )
-        info_note.setStyleSheet("color: #6B7280; font-size: 11px; font-style: italic; margin-left: 10px;")
+        info_note.setObjectName("creditsNote")
         layout.addWidget(info_note)
 
         layout.addSpacing(8)
@@ -199,73 +352,42 @@ class PrivacyDataPage(WizardPage):
             "All AI processing uses AWS Bedrock AgentCore with complete session isolation. "
             "Your data is processed in secure, isolated environments and never retained after analysis."
         )
+        security_info.setObjectName("securityInfo")
         security_info.setWordWrap(True)
-        security_info.setStyleSheet("""
-            background-color: #2A2A2A;
-            border: 1px solid #404040;
-            border-radius: 6px;
-            padding: 10px;
-            color: #9CA3AF;
-            font-size: 12px;
-        """)
         layout.addWidget(security_info)
 
         return group
 
     def _create_advisor_access_section(self) -> QtWidgets.QGroupBox:
-        group = QtWidgets.QGroupBox("AI Advisor Availability")
-        layout = QtWidgets.QVBoxLayout(group)
-        layout.setContentsMargins(18, 15, 18, 15)
-        layout.setSpacing(10)
-        self._apply_group_style(group)
+        group, layout = self._create_group("AI Advisor Availability", 10)
 
         desc = QtWidgets.QLabel("Who can access AI Advisor during discovery?")
-        desc.setStyleSheet("color: #D1D5DB; font-weight: 500; margin-bottom: 8px;")
+        desc.setObjectName("questionLabel")
         layout.addWidget(desc)
 
-        # Radio buttons
-        self.advisor_buttons = {}
-        for value, display in self.ADVISOR_ACCESS_OPTIONS:
-            radio = QtWidgets.QRadioButton(display)
-            radio.setStyleSheet("color: #F9FAFB; padding: 4px;")
-            self.advisor_buttons[value] = radio
-            layout.addWidget(radio)
-
-        # Default to "all"
-        self.advisor_buttons["all"].setChecked(True)
+        # Radio buttons, defaulting to "all"
+        self.advisor_buttons, self.advisor_group = self._add_radio_options(layout, self.ADVISOR_ACCESS_OPTIONS, "all")
 
         # Note
         note = QtWidgets.QLabel(
             "Note: Enabling AI Advisor for respondents improves data quality through "
             "real-time feedback but increases credit usage."
         )
+        note.setObjectName("advisorNote")
         note.setWordWrap(True)
-        note.setStyleSheet("color: #9CA3AF; font-size: 12px; font-style: italic; margin-top: 8px;")
         layout.addWidget(note)
 
         return group
 
     def _create_depletion_policy_section(self) -> QtWidgets.QGroupBox:
-        group = QtWidgets.QGroupBox("Credit Depletion Policy")
-        layout = QtWidgets.QVBoxLayout(group)
-        layout.setContentsMargins(18, 15, 18, 15)
-        layout.setSpacing(10)
-        self._apply_group_style(group)
+        group, layout = self._create_group("Credit Depletion Policy", 10)
 
         desc = QtWidgets.QLabel("What happens when credits run out during discovery?")
-        desc.setStyleSheet("color: #D1D5DB; font-weight: 500; margin-bottom: 8px;")
+        desc.setObjectName("questionLabel")
         layout.addWidget(desc)
 
-        # Radio buttons
-        self.depletion_buttons = {}
-        for value, display in self.DEPLETION_POLICIES:
-            radio = QtWidgets.QRadioButton(display)
-            radio.setStyleSheet("color: #F9FAFB; padding: 4px;")
-            self.depletion_buttons[value] = radio
-            layout.addWidget(radio)
-
-        # Default to "pause"
-        self.depletion_buttons["pause"].setChecked(True)
+        # Radio buttons, defaulting to "pause"
+        self.depletion_buttons, self.depletion_group = self._add_radio_options(layout, self.DEPLETION_POLICIES, "pause")
 
         # Warning
         warning = WarningWidget(
@@ -277,30 +399,19 @@ class PrivacyDataPage(WizardPage):
         return group
 
     def _create_service_engagement_section(self) -> QtWidgets.QGroupBox:
-        group = QtWidgets.QGroupBox("DataWoven RAG && Agentic System Implementation")
-        layout = QtWidgets.QVBoxLayout(group)
-        layout.setContentsMargins(18, 15, 18, 15)
-        layout.setSpacing(12)
-        self._apply_group_style(group)
+        group, layout = self._create_group("DataWoven RAG && Agentic System Implementation", 12)
 
         desc = QtWidgets.QLabel(
             "After reviewing your AI-generated report, would you like to discuss "
             "custom implementation services?"
         )
+        desc.setObjectName("serviceDesc")
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #D1D5DB; margin-bottom: 8px;")
         layout.addWidget(desc)
 
-        # Radio buttons
-        self.service_buttons = {}
-        for value, display in self.SERVICE_INTEREST:
-            radio = QtWidgets.QRadioButton(display)
-            radio.setStyleSheet("color: #F9FAFB; padding: 4px;")
-            self.service_buttons[value] = radio
-            layout.addWidget(radio)
-
-        # Default to "maybe"
-        self.service_buttons["maybe"].setChecked(True)
+        # Radio buttons, defaulting to "maybe"
+        self.service_buttons, self.service_group = self._add_radio_options(layout, self.SERVICE_INTEREST, "maybe")
+        self._needs_email = self.service_group.checkedId() in self._EMAIL_SERVICE_IDS
 
         layout.addSpacing(8)
 
@@ -338,8 +449,8 @@ class PrivacyDataPage(WizardPage):
             "• Access to review data source configurations\n"
             "• Brief technical consultation call"
         )
+        req_note.setObjectName("requirementsNote")
         req_note.setWordWrap(True)
-        req_note.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-top: 8px;")
         contact_layout.addWidget(req_note)
 
         layout.addWidget(self.contact_widget)
@@ -350,11 +461,7 @@ class PrivacyDataPage(WizardPage):
         return group
 
     def _create_privacy_options_section(self) -> QtWidgets.QGroupBox:
-        group = QtWidgets.QGroupBox("Export Privacy Options")
-        layout = QtWidgets.QVBoxLayout(group)
-        layout.setContentsMargins(18, 15, 18, 15)
-        layout.setSpacing(12)
-        self._apply_group_style(group)
+        group, layout = self._create_group("Export Privacy Options", 12)
 
         self.anonymize_check = StyledCheckBox(
             "Anonymize respondent identities in final report",
@@ -367,17 +474,17 @@ class PrivacyDataPage(WizardPage):
         anon_desc = QtWidgets.QLabel(
             "(Replaces names, emails, departments with role identifiers)"
         )
-        anon_desc.setStyleSheet("color: #9CA3AF; font-size: 12px; margin-left: 25px;")
+        anon_desc.setObjectName("anonymizeDesc")
         layout.addWidget(anon_desc)
 
         layout.addSpacing(8)
 
         # Exclusion field
         excl_label = QtWidgets.QLabel("Exclude sensitive information from AI analysis:")
-        excl_label.setStyleSheet("color: #F9FAFB; font-weight: 500;")
+        excl_label.setObjectName("fieldLabel")
         layout.addWidget(excl_label)
 
-        self.exclusion_text = QtWidgets.QTextEdit()
+        self.exclusion_text = QtWidgets.QPlainTextEdit()
         self.exclusion_text.setPlaceholderText(
             "Examples: Client names, Project codenames, Revenue figures\n\n"
             "Enter one item per line or comma-separated"
@@ -394,171 +501,76 @@ class PrivacyDataPage(WizardPage):
 
         return group
 
-    def _apply_group_style(self, group: QtWidgets.QGroupBox):
-        """Apply consistent styling matching other wizard pages"""
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: 500;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 16px;
-                padding-top: 15px;
-                font-size: 16px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #F9FAFB;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
-
     def _connect_signals(self):
         """Connect UI signals"""
         # Service interest radio buttons
-        for radio in self.service_buttons.values():
-            radio.toggled.connect(self._update_contact_visibility)
-            radio.toggled.connect(self._validate_form)
-
-        # Contact email for validation
-        self.contact_email.textChanged.connect(self._validate_form)
+        self.service_group.idToggled.connect(self._on_service_toggled)
+
+        # Contact email for validation; start() restarts the debounce on each keystroke,
+        # and finishing the edit (Enter or focus out) validates without waiting it out
+        self.contact_email.textChanged.connect(self._validate_timer.start)
+        self.contact_email.editingFinished.connect(self._validate_form)
+
+    @QtCore.Slot(int, bool)
+    def _on_service_toggled(self, button_id: int, checked: bool):
+        """Cache whether the chosen service interest needs an email, then refresh"""
+        if not checked:
+            return  # The newly checked button's toggle follows
+        self._needs_email = button_id in self._EMAIL_SERVICE_IDS
+        if self._loading:
+            return
+        self._update_contact_visibility()
+        self._validate_form()
 
+    @QtCore.Slot()
     def _update_contact_visibility(self):
         """Show/hide contact form based on service interest"""
-        show_contact = (
-            self.service_buttons["yes"].isChecked() or
-            self.service_buttons["maybe"].isChecked()
-        )
-        self.contact_widget.setVisible(show_contact)
+        show_contact = self._needs_email
+        if show_contact != self._contact_visible:
+            self._contact_visible = show_contact
+            self.contact_widget.setVisible(show_contact)
 
+    @QtCore.Slot()
     def _validate_form(self):
         """Validate form and emit canProceed signal"""
+        self._validate_timer.stop()
         # Check if service interest requires email
-        needs_email = (
-            self.service_buttons["yes"].isChecked() or
-            self.service_buttons["maybe"].isChecked()
-        )
-
-        if needs_email:
+        if self._needs_email:
             has_email = bool(self.contact_email.text().strip())
             self.canProceed.emit(has_email)
         else:
             # No email required if they selected "No"
             self.canProceed.emit(True)
 
-    def showEvent(self, event):
-        """Apply input styles when page becomes visible"""
-        super().showEvent(event)
-        self._apply_input_styles()
-
-    def _apply_input_styles(self):
-        """Apply consistent input styling"""
-        input_style = """
-            QLineEdit {
-                background-color: #404040;
-                border: 1px solid #606060;
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #F9FAFB;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #808080;
-                background-color: #606060;
-            }
-            QTextEdit {
-                background-color: #404040;
-                border: 1px solid #606060;
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #F9FAFB;
-                font-size: 14px;
-            }
-            QTextEdit:focus {
-                border-color: #808080;
-                background-color: #606060;
-            }
-            QComboBox {
-                padding: 8px 12px;
-            }
-            QRadioButton {
-                color: #F9FAFB;
-                spacing: 8px;
-            }
-            QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 10px;
-                border: 2px solid #606060;
-                background-color: #404040;
-            }
-            QRadioButton::indicator:checked {
-                border: 2px solid #0BE5F5;  /* Blue border when selected */
-                background-color: #0BE5F5;  /* Blue fill when selected */
-            }
-            QRadioButton::indicator:unchecked {
-                border: 2px solid #606060;  /* Gray border when not selected */
-                background-color: #404040;  /* Dark gray fill when not selected */
-            }
-            QRadioButton::indicator:hover {
-                border-color: #808080;
-            }
-        """
-        self.setStyleSheet(self.styleSheet() + input_style)
-
     # WizardPage interface implementation
     def validate_page(self) -> Tuple[bool, str]:
         """Validate the page data"""
+        self._ensure_sections()
         # Check if email is required and provided
-        needs_email = (
-            self.service_buttons["yes"].isChecked() or
-            self.service_buttons["maybe"].isChecked()
-        )
-
-        if needs_email and not self.contact_email.text().strip():
-            return False, "Contact email is required when requesting implementation services."
-
-        # Basic email validation
-        if needs_email:
+        if self._needs_email:
             email = self.contact_email.text().strip()
-            if '@' not in email or '.' not in email:
+            if not email:
+                return False, "Contact email is required when requesting implementation services."
+
+            # Basic email validation
+            if not _EMAIL_RE.fullmatch(email):
                 return False, "Please enter a valid email address."
 
         return True, ""
 
     def collect_data(self) -> Dict[str, Any]:
         """Collect page data for wizard"""
-        # Get selected advisor access
-        advisor_access = "all"
-        for value, radio in self.advisor_buttons.items():
-            if radio.isChecked():
-                advisor_access = value
-                break
-
-        # Get selected depletion policy
-        depletion_policy = "pause"
-        for value, radio in self.depletion_buttons.items():
-            if radio.isChecked():
-                depletion_policy = value
-                break
-
-        # Get selected service interest
-        service_interest = "no"
-        for value, radio in self.service_buttons.items():
-            if radio.isChecked():
-                service_interest = value
-                break
-
-        # Parse exclusion text
-        exclusion_text = self.exclusion_text.toPlainText().strip()
-        exclusions = []
-        if exclusion_text:
-            # Split by newline or comma
-            for line in exclusion_text.split('\n'):
-                items = [item.strip() for item in line.split(',') if item.strip()]
-                exclusions.extend(items)
+        self._ensure_sections()
+        # Button group ids are indexes into the option lists
+        advisor_access = self.ADVISOR_ACCESS_OPTIONS[self.advisor_group.checkedId()][0]
+        depletion_policy = self.DEPLETION_POLICIES[self.depletion_group.checkedId()][0]
+        service_interest = self.SERVICE_INTEREST[self.service_group.checkedId()][0]
+
+        # Parse exclusion text: one pass over newline/comma separators, blanks dropped
+        exclusions = [
+            item for item in map(str.strip, _EXCLUSION_SPLIT.split(self.exclusion_text.toPlainText()))
+            if item
+        ]
 
         return {
             "ai_configuration": {
@@ -582,45 +594,50 @@ class PrivacyDataPage(WizardPage):
 
     def load_data(self, data: Dict[str, Any]) -> None:
         """Load existing data into the page"""
+        self._ensure_sections()
         ai_config = data.get("ai_configuration", {})
         service = data.get("service_engagement", {})
         privacy = data.get("privacy", {})
 
-        # Load AI configuration
-        additional_credits = ai_config.get("additional_credits_purchased", 0)
-        for i in range(self.credits_combo.count()):
-            if self.credits_combo.itemData(i) == additional_credits:
-                self.credits_combo.setCurrentIndex(i)
-                break
-
-        advisor_access = ai_config.get("advisor_access", "all")
-        if advisor_access in self.advisor_buttons:
-            self.advisor_buttons[advisor_access].setChecked(True)
-
-        depletion = ai_config.get("depletion_policy", "pause")
-        if depletion in self.depletion_buttons:
-            self.depletion_buttons[depletion].setChecked(True)
-
-        # Load service engagement
-        interest = service.get("interested", "maybe")
-        if interest in self.service_buttons:
-            self.service_buttons[interest].setChecked(True)
-
-        self.contact_email.setText(service.get("contact_email", ""))
-        self.contact_phone.setText(service.get("contact_phone", ""))
-
-        company_size = service.get("company_size", "")
-        if company_size:
-            index = self.company_size_combo.findText(company_size)
+        # Handlers only refresh caches while loading; visibility and validity run once below
+        self._loading = True
+        try:
+            # Load AI configuration
+            additional_credits = ai_config.get("additional_credits_purchased", 0)
+            index = self.credits_combo.findData(additional_credits)
             if index >= 0:
-                self.company_size_combo.setCurrentIndex(index)
-
-        # Load privacy options
-        self.anonymize_check.setChecked(privacy.get("anonymize_respondents", False))
-
-        exclusions = privacy.get("excluded_terms", [])
-        if exclusions:
-            self.exclusion_text.setPlainText("\n".join(exclusions))
+                self.credits_combo.setCurrentIndex(index)
+
+            advisor_access = ai_config.get("advisor_access", "all")
+            if advisor_access in self.advisor_buttons:
+                self.advisor_buttons[advisor_access].setChecked(True)
+
+            depletion = ai_config.get("depletion_policy", "pause")
+            if depletion in self.depletion_buttons:
+                self.depletion_buttons[depletion].setChecked(True)
+
+            # Load service engagement
+            interest = service.get("interested", "maybe")
+            if interest in self.service_buttons:
+                self.service_buttons[interest].setChecked(True)
+
+            self.contact_email.setText(service.get("contact_email", ""))
+            self.contact_phone.setText(service.get("contact_phone", ""))
+
+            company_size = service.get("company_size", "")
+            if company_size:
+                index = self.company_size_combo.findText(company_size)
+                if index >= 0:
+                    self.company_size_combo.setCurrentIndex(index)
+
+            # Load privacy options
+            self.anonymize_check.setChecked(privacy.get("anonymize_respondents", False))
+
+            exclusions = privacy.get("excluded_terms", [])
+            if exclusions:
+                self.exclusion_text.setPlainText("\n".join(exclusions))
+        finally:
+            self._loading = False
 
         self._update_contact_visibility()
         self._validate_form()
@@ -1,10 +1,66 @@
 import re
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 from PySide6 import QtWidgets, QtCore, QtGui
 from discovery_assistant.wizard_base import WizardPage
 from discovery_assistant.ui.widgets.styled_checkbox import StyledCheckBox
-
-class ProjectSetupPage(WizardPage):
+from discovery_assistant.ui.wizard_pages.page_styles import PAGE_HEADER_QSS, GROUP_QSS
+from discovery_assistant.ui.wizard_pages.deferred_sections import DeferredSectionsMixin
+
+# Simple email validation regex, compiled once and shared by every check
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+LABEL_QSS = """
+    QLabel#fieldLabel {
+        color: #F9FAFB;
+        font-weight: 500;
+        margin-bottom: 3px;
+    }
+    QLabel#fieldNote {
+        color: #9CA3AF;
+        font-size: 12px;
+        font-style: italic;
+    }
+    QLabel#timelineLabel {
+        color: #F9FAFB;
+        font-weight: 500;
+        margin-left: 25px;
+    }
+    QLabel#contextLabel {
+        color: #F9FAFB;
+        font-weight: 500;
+    }
+"""
+
+INPUT_QSS = """
+    QLineEdit {
+        background-color: #404040;
+        border: 1px solid #606060;
+        border-radius: 6px;
+        padding: 8px 12px;
+        color: #F9FAFB;
+        font-size: 14px;
+    }
+    QLineEdit:focus {
+        border-color: #808080;
+        background-color: #606060;
+    }
+    QTextEdit {
+        background-color: #404040;
+        border: 1px solid #606060;
+        border-radius: 6px;
+        padding: 8px 12px;
+        color: #F9FAFB;
+        font-size: 14px;
+    }
+    QTextEdit:focus {
+        border-color: #808080;
+        background-color: #606060;
+    }
+"""
+
+PAGE_QSS = PAGE_HEADER_QSS + GROUP_QSS + LABEL_QSS + INPUT_QSS
+
+class ProjectSetupPage(DeferredSectionsMixin, WizardPage):
 
     """
     Project Setup Page - Step 2 of Admin Setup Wizard
@@ -13,13 +69,29 @@ class ProjectSetupPage(WizardPage):
 
     def __init__(self, parent=None):
         super().__init__("Project Setup", parent)
-        self._setup_ui()
-        self._connect_signals()
 
-        # Initial validation check
-        self._validate_form()
+        # Validation runs once typing pauses rather than on every keystroke;
+        # the email field has its own timer so its status label follows it too
+        self._validate_timer = QtCore.QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(120)
+        self._validate_timer.timeout.connect(self._validate_form)
+
+        self._email_timer = QtCore.QTimer(self)
+        self._email_timer.setSingleShot(True)
+        self._email_timer.setInterval(120)
+        self._email_timer.timeout.connect(self._validate_email)
+
+        # Last email checked by _validate_email and its result, reused by _validate_form
+        self._last_email = None
+        self._last_email_valid = False
+
+        self._setup_ui()
+        self._start_deferred_sections()
 
     def _setup_ui(self):
+        self.setStyleSheet(PAGE_QSS)
+
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(40, 30, 40, 30)
         layout.setSpacing(20)
@@ -38,14 +110,6 @@ class ProjectSetupPage(WizardPage):
         # Title
         title = QtWidgets.QLabel("Project Setup")
         title.setObjectName("pageTitle")
-        title.setStyleSheet("""
-            #pageTitle {
-                font-size: 24px;
-                font-weight: 600;
-                color: #F9FAFB;
-                margin-bottom: 8px;
-            }
-        """)
 
         # Description
         description = QtWidgets.QLabel(
@@ -57,14 +121,6 @@ class ProjectSetupPage(WizardPage):
         )
         description.setWordWrap(True)
         description.setObjectName("pageDescription")
-        description.setStyleSheet("""
-            #pageDescription {
-                font-size: 14px;
-                color: #D1D5DB;
-                line-height: 1.5;
-                margin-bottom: 10px;
-            }
-        """)
 
         layout.addWidget(title)
         layout.addWidget(description)
@@ -79,35 +135,39 @@ class ProjectSetupPage(WizardPage):
         org_group = self._create_organization_section()
         layout.addWidget(org_group)
 
-        # Add spacing to match welcome screen
-        layout.addSpacing(25)
-
-        # Administrator contact section
-        admin_group = self._create_administrator_section()
-        layout.addWidget(admin_group)
-
-        # Add spacing to match welcome screen
-        layout.addSpacing(25)
-
-        # Project configuration section
-        project_group = self._create_project_section()
-        layout.addWidget(project_group)
-
         # Add spacer to prevent stretching
         layout.addStretch()
 
+        # Administrator contact and project configuration sections are
+        # inserted above the spacer, in this order, as deferred sections
+        self._content_layout = layout
+        self._pending_sections = [
+            self._create_administrator_section,
+            self._create_project_section,
+        ]
+
         return widget
 
+    def _add_section(self, section: QtWidgets.QWidget):
+        """Insert a deferred section above the trailing spacer"""
+        index = self._content_layout.count() - 1
+        # Add spacing to match welcome screen
+        self._content_layout.insertSpacing(index, 25)
+        self._content_layout.insertWidget(index + 1, section)
+
+    def _on_sections_built(self):
+        self._connect_signals()
+
     def _create_organization_section(self) -> QtWidgets.QGroupBox:
         group = QtWidgets.QGroupBox("Organization Information")
-        group.setObjectName("orgGroup")
+        group.setObjectName("pageGroup")
         layout = QtWidgets.QVBoxLayout(group)
         layout.setContentsMargins(18, 15, 18, 15)
         layout.setSpacing(5)
 
         # Organization name (required)
         org_label = QtWidgets.QLabel("Organization Name *")
-        org_label.setStyleSheet("color: #F9FAFB; font-weight: 500; margin-bottom: 3px;")
+        org_label.setObjectName("fieldLabel")
         layout.addWidget(org_label)
 
         self.org_name_input = QtWidgets.QLineEdit()
@@ -118,7 +178,7 @@ class ProjectSetupPage(WizardPage):
 
         # Project description (optional)
         desc_label = QtWidgets.QLabel("Project Description")
-        desc_label.setStyleSheet("color: #F9FAFB; font-weight: 500; margin-bottom: 3px;")
+        desc_label.setObjectName("fieldLabel")
         layout.addWidget(desc_label)
 
         self.project_desc_input = QtWidgets.QTextEdit()
@@ -127,19 +187,18 @@ class ProjectSetupPage(WizardPage):
         self.project_desc_input.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         layout.addWidget(self.project_desc_input)
 
-        self._apply_group_style(group)
         return group
 
     def _create_administrator_section(self) -> QtWidgets.QGroupBox:
         group = QtWidgets.QGroupBox("Administrator Contact")
-        group.setObjectName("adminGroup")
+        group.setObjectName("pageGroup")
         layout = QtWidgets.QVBoxLayout(group)
         layout.setContentsMargins(18, 15, 18, 15)
         layout.setSpacing(5)
 
         # Administrator name (required)
         admin_name_label = QtWidgets.QLabel("Administrator Name *")
-        admin_name_label.setStyleSheet("color: #F9FAFB; font-weight: 500; margin-bottom: 3px; margin-left: 0px;")
+        admin_name_label.setObjectName("fieldLabel")
         layout.addWidget(admin_name_label)
 
         self.admin_name_input = QtWidgets.QLineEdit()
@@ -150,7 +209,7 @@ class ProjectSetupPage(WizardPage):
 
         # Administrator email (required)
         admin_email_label = QtWidgets.QLabel("Administrator Email *")
-        admin_email_label.setStyleSheet("color: #F9FAFB; font-weight: 500; margin-bottom: 3px; margin-left: 0px;")
+        admin_email_label.setObjectName("fieldLabel")
         layout.addWidget(admin_email_label)
 
         self.admin_email_input = QtWidgets.QLineEdit()
@@ -166,16 +225,15 @@ class ProjectSetupPage(WizardPage):
 
         # Contact note
         contact_note = QtWidgets.QLabel("This contact information will be displayed to respondents for support.")
-        contact_note.setStyleSheet("color: #9CA3AF; font-size: 12px; font-style: italic;")
+        contact_note.setObjectName("fieldNote")
         contact_note.setWordWrap(True)
         layout.addWidget(contact_note)
 
-        self._apply_group_style(group)
         return group
 
     def _create_project_section(self) -> QtWidgets.QGroupBox:
         group = QtWidgets.QGroupBox("Project Configuration")
-        group.setObjectName("projectGroup")
+        group.setObjectName("pageGroup")
         layout = QtWidgets.QVBoxLayout(group)
         layout.setContentsMargins(18, 15, 18, 15)
         layout.setSpacing(15)
@@ -194,7 +252,7 @@ class ProjectSetupPage(WizardPage):
         timeline_layout.setSpacing(10)
 
         timeline_label = QtWidgets.QLabel("Target Completion Date")
-        timeline_label.setStyleSheet("color: #F9FAFB; font-weight: 500; margin-left: 25px;")
+        timeline_label.setObjectName("timelineLabel")
 
         self.timeline_date = QtWidgets.QDateEdit()
         self.timeline_date.setDate(QtCore.QDate.currentDate().addDays(30))  # Default to 30 days from now
@@ -211,7 +269,7 @@ class ProjectSetupPage(WizardPage):
 
         # Organizational context (optional)
         context_label = QtWidgets.QLabel("Organizational Context / Notes")
-        context_label.setStyleSheet("color: #F9FAFB; font-weight: 500;")
+        context_label.setObjectName("contextLabel")
         layout.addWidget(context_label)
 
         self.context_input = QtWidgets.QTextEdit()
@@ -220,48 +278,37 @@ class ProjectSetupPage(WizardPage):
         self.context_input.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         layout.addWidget(self.context_input)
 
-        self._apply_group_style(group)
         return group
 
-    def _apply_group_style(self, group: QtWidgets.QGroupBox):
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: 500;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 16px;
-                padding-top: 15px;
-                font-size: 16px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #F9FAFB;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
-
     def _connect_signals(self):
-        # Form validation triggers
-        self.org_name_input.textChanged.connect(self._validate_form)
-        self.admin_name_input.textChanged.connect(self._validate_form)
-        self.admin_email_input.textChanged.connect(self._validate_email)
+        # Form validation triggers; start() restarts the debounce on each keystroke
+        self.org_name_input.textChanged.connect(self._validate_timer.start)
+        self.admin_name_input.textChanged.connect(self._validate_timer.start)
+        self.admin_email_input.textChanged.connect(self._email_timer.start)
 
         # Timeline checkbox toggle
         self.timeline_checkbox.toggled.connect(self._toggle_timeline)
 
+    def _snapshot(self) -> Tuple[str, str, str]:
+        """Stripped (organization, administrator, email) text, read once per pass"""
+        return (
+            self.org_name_input.text().strip(),
+            self.admin_name_input.text().strip(),
+            self.admin_email_input.text().strip(),
+        )
+
     def _validate_email(self):
-        email = self.admin_email_input.text().strip()
+        self._email_timer.stop()
+        snapshot = self._snapshot()
+        email = snapshot[2]
 
         if not email:
             self.email_status_label.setText("")
             self.email_status_label.setStyleSheet("")
         else:
-            # Simple email validation regex
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            is_valid = re.match(email_pattern, email) is not None
+            is_valid = _EMAIL_RE.fullmatch(email) is not None
+            self._last_email = email
+            self._last_email_valid = is_valid
 
             if is_valid:
                 self.email_status_label.setText("✓ Valid email format")
@@ -270,66 +317,34 @@ class ProjectSetupPage(WizardPage):
                 self.email_status_label.setText("✗ Invalid email format")
                 self.email_status_label.setStyleSheet("color: #EF4444; font-size: 12px;")
 
-        self._validate_form()
+        self._validate_form(snapshot)
 
     def _toggle_timeline(self, checked: bool):
         self.timeline_widget.setVisible(checked)
 
-    def _validate_form(self):
-        org_name = self.org_name_input.text().strip()
-        admin_name = self.admin_name_input.text().strip()
-        admin_email = self.admin_email_input.text().strip()
+    def _validate_form(self, snapshot: Optional[Tuple[str, str, str]] = None):
+        self._validate_timer.stop()
+        org_name, admin_name, admin_email = snapshot or self._snapshot()
 
         # Check if all required fields are filled
         has_required = bool(org_name and admin_name and admin_email)
 
         # Check email validity if provided
         email_valid = True
-        if admin_email:
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            email_valid = re.match(email_pattern, admin_email) is not None
+        if admin_email == self._last_email:
+            email_valid = self._last_email_valid
+        elif admin_email:
+            email_valid = _EMAIL_RE.fullmatch(admin_email) is not None
 
         can_proceed = has_required and email_valid
         self.canProceed.emit(can_proceed)
 
-    def showEvent(self, event):
-        super().showEvent(event)
-        self._apply_input_styles()
-
-    def _apply_input_styles(self):
-        input_style = """
-            QLineEdit {
-                background-color: #404040;
-                border: 1px solid #606060;
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #F9FAFB;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #808080;
-                background-color: #606060;
-            }
-            QTextEdit {
-                background-color: #404040;
-                border: 1px solid #606060;
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #F9FAFB;
-                font-size: 14px;
-            }
-            QTextEdit:focus {
-                border-color: #808080;
-                background-color: #606060;
-            }
-        """
-        self.setStyleSheet(self.styleSheet() + input_style)
-
     def validate_page(self) -> Tuple[bool, str]:
         """Validate the page data."""
-        org_name = self.org_name_input.text().strip()
-        admin_name = self.admin_name_input.text().strip()
-        admin_email = self.admin_email_input.text().strip()
+        self._ensure_sections()
+        # Flush any debounced pass now rather than letting it fire after navigation
+        self._validate_email()
+        org_name, admin_name, admin_email = self._snapshot()
 
         # Check required fields
         if not org_name:
@@ -342,19 +357,20 @@ class ProjectSetupPage(WizardPage):
             return False, "Administrator email is required."
 
         # Validate email format
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, admin_email):
+        if not _EMAIL_RE.fullmatch(admin_email):
             return False, "Please enter a valid email address."
 
         return True, ""
 
     def collect_data(self) -> Dict[str, Any]:
         """Collect page data for wizard."""
+        self._ensure_sections()
+        org_name, admin_name, admin_email = self._snapshot()
         data = {
-            "organization_name": self.org_name_input.text().strip(),
+            "organization_name": org_name,
             "project_description": self.project_desc_input.toPlainText().strip(),
-            "administrator_name": self.admin_name_input.text().strip(),
-            "administrator_email": self.admin_email_input.text().strip(),
+            "administrator_name": admin_name,
+            "administrator_email": admin_email,
             "has_timeline": self.timeline_checkbox.isChecked(),
             "organizational_context": self.context_input.toPlainText().strip()
         }
@@ -367,6 +383,7 @@ class ProjectSetupPage(WizardPage):
 
     def load_data(self, data: Dict[str, Any]) -> None:
         """Load existing data into the page."""
+        self._ensure_sections()
         # Load organization information
         self.org_name_input.setText(data.get("organization_name", ""))
         self.project_desc_input.setPlainText(data.get("project_description", ""))